@@ -1,38 +1,102 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import asyncio
+import hashlib
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
+try:
+	# Optional: faster parsing of grounder output; stdlib json is used when orjson is not installed
+	import orjson as _json
+except ImportError:
+	import json as _json
+
+from ..env import env_flag
 from ..llm.openai_compat_client import DualModelLLM, OpenAICompatClient
 
 
-def _repo_root() -> Path:
-	# newserver/agents/llm_action_provider.py -> repo root
-	return Path(__file__).resolve().parents[2]
+# Debug switches are read once at import (env does not change during a run)
+_LLM_DEBUG_PROMPTS = env_flag("LLM_DEBUG_PROMPTS")
+_LLM_DISABLE_INTENT_CACHE = env_flag("LLM_DISABLE_INTENT_CACHE")
+
+# Template placeholder: {{key}}
+_TEMPLATE_RE = re.compile(r"\{\{(\w+)\}\}")
+
+# Grounder output: outermost JSON array (works with or without a ```json fence around it)
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+
+
+# newserver/agents/llm_action_provider.py -> repo root (resolved once at import)
+_REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
 def _read_text(path: Path) -> str:
 	return path.read_text(encoding="utf-8")
 
 
-def _fill_template(template: str, mapping: dict[str, Any]) -> str:
-	out = str(template)
-	for k, v in (mapping or {}).items():
-		out = out.replace(f"{{{{{k}}}}}", str(v))
-	return out
+class _KeepMissing:
+	"""
+	format_map mapping: unknown placeholders are rendered back as {{key}} (kept as-is in the prompt).
+	Read-through view over the caller's dict (no copy per fill).
+	"""
+
+	__slots__ = ("_mapping",)
+
+	def __init__(self, mapping: dict[str, Any]) -> None:
+		self._mapping = mapping
+
+	def __getitem__(self, key: str) -> Any:
+		try:
+			return self._mapping[key]
+		except KeyError:
+			return f"{{{{{key}}}}}"
+
+
+def _compile_template(template: str) -> str:
+	"""
+	Convert a {{key}} Markdown template into a str.format_map format string (done once per template).
+	Literal braces are escaped, so only {{key}} placeholders are substituted.
+	"""
+
+	parts: list[str] = []
+	pos = 0
+	for mo in _TEMPLATE_RE.finditer(str(template)):
+		parts.append(template[pos:mo.start()].replace("{", "{{").replace("}", "}}"))
+		key = mo.group(1)
+		# Numeric names would be treated as positional fields by format_map: keep them literal
+		parts.append(f"{{{key}}}" if key.isidentifier() else mo.group(0).replace("{", "{{").replace("}", "}}"))
+		pos = mo.end()
+	parts.append(template[pos:].replace("{", "{{").replace("}", "}}"))
+	return "".join(parts)
+
+
+def _fill_template(compiled_template: str, mapping: dict[str, Any]) -> str:
+	# compiled_template comes from _compile_template; substitution happens in one C-level pass
+	return compiled_template.format_map(_KeepMissing(mapping if mapping is not None else {}))
+
+
+def _s(d: dict[str, Any] | None, key: str, default: str = "") -> str:
+	# Same result as str(d.get(key) or default), without building a throwaway {} or re-wrapping values that are already str
+	v = d.get(key, default) if d else default
+	return v if type(v) is str else str(v or default)
+
+
+@lru_cache(maxsize=4096)
+def _entity_line(eid: str, name: str, tags: tuple[str, ...]) -> str:
+	# Memoized: the same entity usually renders identically tick after tick
+	return f"- id: {eid}, name: {name}, tags: {list(tags)}"
 
 
 def _entities_table(entities: list[dict[str, Any]]) -> str:
-	lines: list[str] = []
-	for e in list(entities or []):
-		if not isinstance(e, dict):
-			continue
-		eid = str(e.get("id", "") or "")
-		name = str(e.get("name", "") or "")
-		tags = e.get("tags", []) or []
-		lines.append(f"- id: {eid}, name: {name}, tags: {list(tags)}")
+	lines = [
+		_entity_line(_s(e, "id"), _s(e, "name"), tuple(str(t) for t in (e.get("tags", []) or [])))
+		for e in (entities or [])
+		if isinstance(e, dict)
+	]
 	return "\n".join(lines) if lines else "(No visible entities)"
 
 
@@ -42,7 +106,7 @@ def _interactions_text(interactions: list[dict[str, Any]]) -> str:
 		if not isinstance(it, dict):
 			continue
 		tick = it.get("tick", None)
-		text = str(it.get("text", "") or "")
+		text = _s(it, "text")
 		if tick is None:
 			lines.append(f"- {text}")
 		else:
@@ -50,7 +114,33 @@ def _interactions_text(interactions: list[dict[str, Any]]) -> str:
 	return "\n".join(lines) if lines else "(No recent interaction narrative)"
 
 
-def _build_available_verbs(recipe_db: dict[str, Any], visible_entities: list[dict[str, Any]]) -> tuple[str, str, set[str]]:
+@dataclass(frozen=True, slots=True)
+class RecipeVerbIndex:
+	"""
+	recipe_db preprocessed once: (verb, required target tags, is_duration) per recipe, in recipe_db order.
+	Per-decision verb filtering is then only a subset check per entry.
+	"""
+
+	entries: tuple[tuple[str, frozenset[str], bool], ...] = ()
+
+	@classmethod
+	def from_recipe_db(cls, recipe_db: dict[str, Any]) -> RecipeVerbIndex:
+		entries: list[tuple[str, frozenset[str], bool]] = []
+		for _rid, recipe in (recipe_db or {}).items():
+			if not isinstance(recipe, dict):
+				continue
+			# Interned: verbs are a small repeated vocabulary, so membership checks can hit the identity fast path
+			verb = sys.intern(str(recipe.get("verb", "") or "").strip())
+			if not verb:
+				continue
+			req_tags = frozenset(str(t) for t in (recipe.get("target_tags", []) or []))
+			process = recipe.get("process", {}) or {}
+			required_progress = float((process or {}).get("required_progress", 0) or 0)
+			entries.append((verb, req_tags, required_progress != 0))
+		return cls(entries=tuple(entries))
+
+
+def _build_available_verbs(verb_index: RecipeVerbIndex, visible_tags: frozenset[str]) -> tuple[str, str, frozenset[str]]:
 	"""
 	Return:
 	- available_verbs_list: verb list for grounder (text)
@@ -58,48 +148,57 @@ def _build_available_verbs(recipe_db: dict[str, Any], visible_entities: list[dic
 	- allowed_verbs_set: for validation
 	"""
 
-	# Visible tag set (n)
-	visible_tags: set[str] = set()
-	for e in list(visible_entities or []):
-		tags = (e or {}).get("tags", []) or []
-		for t in list(tags):
-			visible_tags.add(str(t))
-
 	verbs: dict[str, str] = {}  # verb -> "instant"/"duration"
-	for _rid, recipe in (recipe_db or {}).items():
-		if not isinstance(recipe, dict):
-			continue
-		verb = str(recipe.get("verb", "") or "").strip()
-		if not verb:
-			continue
-		req_tags = list(recipe.get("target_tags", []) or [])
+	for verb, req_tags, is_duration in verb_index.entries:
 		# If no target_tags, default to available; otherwise need visible entity meeting tags
-		ok = True
-		if req_tags:
-			ok = True
-			for tag in req_tags:
-				if str(tag) not in visible_tags:
-					ok = False
-					break
-		if not ok:
+		if not req_tags <= visible_tags:
 			continue
-		process = recipe.get("process", {}) or {}
-		required_progress = float((process or {}).get("required_progress", 0) or 0)
-		verbs[verb] = "duration" if required_progress != 0 else "instant"
+		verbs[verb] = "duration" if is_duration else "instant"
+
+	allowed = frozenset(verbs.keys())
+	available_verbs_list, available_verbs_with_duration = _render_verbs(frozenset(verbs.items()))
+	return (available_verbs_list, available_verbs_with_duration, allowed)
 
-	allowed = set(verbs.keys())
+
+@lru_cache(maxsize=64)
+def _render_verbs(verbs: frozenset[tuple[str, str]]) -> tuple[str, str]:
+	"""
+	Render (verb, "instant"/"duration") pairs into prompt text.
+	Memoized: the allowed verb set is usually stable across ticks, so the sort + join is skipped on repeat.
+	"""
+
+	items = sorted(verbs)
 
 	# For grounder: Only verb names (m)
-	available_verbs_list = "\n".join([f"- {v}" for v in sorted(allowed)]) if allowed else "(No available verbs)"
+	available_verbs_list = "\n".join([f"- {v}" for v, _kind in items]) if items else "(No available verbs)"
 
 	# For planner: verb + instant/duration (m)
-	with_duration_lines = [f"- {v}: {verbs[v]}" for v in sorted(allowed)]
+	with_duration_lines = [f"- {v}: {kind}" for v, kind in items]
 	available_verbs_with_duration = "\n".join(with_duration_lines) if with_duration_lines else "(No available verbs)"
 
-	return (available_verbs_list, available_verbs_with_duration, allowed)
+	return (available_verbs_list, available_verbs_with_duration)
 
 
 @dataclass
+class _DecisionInputs:
+	"""
+	Per-decision state shared by the planner step and the grounder step (sync and async paths).
+	"""
+
+	planner_prompt: str
+	tick_str: str
+	loc_id: str
+	loc_name: str
+	entities_table: str
+	interactions_text: str
+	available_verbs_list: str
+	allowed_verbs: frozenset[str]
+	visible_ids: frozenset[str]
+	agent_id: str = ""
+	intent_fingerprint: str = ""
+
+
+@dataclass(slots=True)
 class LLMActionProvider:
 	"""
 	Two-Layer LLM Action Generator:
@@ -111,9 +210,28 @@ class LLMActionProvider:
 	"""
 
 	llm: DualModelLLM
-	planner_template_path: Path = _repo_root() / "Data" / "LLMContext_Planner.md"
-	grounder_template_path: Path = _repo_root() / "Data" / "LLMContext_Grounder.md"
+	planner_template_path: Path = _REPO_ROOT / "Data" / "LLMContext_Planner.md"
+	grounder_template_path: Path = _REPO_ROOT / "Data" / "LLMContext_Grounder.md"
 	debug: bool = False
+	# Optional: verb index precomputed at build time (see build_default_llm_provider); if None, built lazily from perception's recipe_db
+	verb_index: RecipeVerbIndex | None = None
+	# Max consecutive reuses of a cached planner intent before the planner is forced to run again
+	intent_cache_ttl: int = 5
+
+	# Templates are immutable for the lifetime of the process: read and compiled once on first use, not on every decide()
+	_planner_template: str | None = field(default=None, init=False, repr=False)
+	_grounder_template: str | None = field(default=None, init=False, repr=False)
+	# {{key}} placeholders referenced by the loaded templates (unreferenced sections are not rendered)
+	_template_keys: frozenset[str] = field(default=frozenset(), init=False, repr=False)
+
+	# Verb index of the last seen recipe_db (recipe_db is static during a run; rebuilt only when a different dict is passed)
+	_lazy_verb_index: RecipeVerbIndex = field(default_factory=RecipeVerbIndex, init=False, repr=False)
+	_verb_index_source: dict[str, Any] | None = field(default=None, init=False, repr=False)
+	# visible tag set -> _build_available_verbs result, valid for the current verb index only (cleared on rebuild)
+	_available_verbs_cache: dict[frozenset[str], tuple[str, str, frozenset[str]]] = field(default_factory=dict, init=False, repr=False)
+
+	# agent_id -> (fingerprint, intent, reuse count): skip the planner call when the salient inputs did not change
+	_intent_cache: dict[str, tuple[str, str, int]] = field(default_factory=dict, init=False, repr=False)
 
 	# System Prompt Definition
 	PLANNER_SYSTEM_PROMPT = """
@@ -148,159 +266,270 @@ You are an "Action Grounder". Your task is to translate Planner's natural langua
 6. DO NOT add any Markdown tags (like ```json) around JSON, ONLY output pure JSON string.
 """
 
+	# System messages are built once and shared by every request (read-only; byte-identical prefix across calls)
+	_PLANNER_SYSTEM_MESSAGE: ClassVar[dict[str, str]] = {"role": "system", "content": PLANNER_SYSTEM_PROMPT.strip()}
+	_GROUNDER_SYSTEM_MESSAGE: ClassVar[dict[str, str]] = {"role": "system", "content": GROUNDER_SYSTEM_PROMPT.strip()}
+
+	def _get_planner_template(self) -> str:
+		if self._planner_template is None:
+			text = _read_text(self.planner_template_path)
+			self._planner_template = _compile_template(text)
+			self._template_keys = self._template_keys | frozenset(_TEMPLATE_RE.findall(text))
+		return self._planner_template
+
+	def _get_grounder_template(self) -> str:
+		if self._grounder_template is None:
+			text = _read_text(self.grounder_template_path)
+			self._grounder_template = _compile_template(text)
+			self._template_keys = self._template_keys | frozenset(_TEMPLATE_RE.findall(text))
+		return self._grounder_template
+
+	def _get_template_keys(self) -> frozenset[str]:
+		# Loads both templates on first use
+		self._get_planner_template()
+		self._get_grounder_template()
+		return self._template_keys
+
+	def _get_verb_index(self, recipe_db: dict[str, Any]) -> RecipeVerbIndex:
+		if self.verb_index is not None:
+			return self.verb_index
+		if recipe_db is not self._verb_index_source:
+			self._lazy_verb_index = RecipeVerbIndex.from_recipe_db(recipe_db)
+			self._verb_index_source = recipe_db
+			self._available_verbs_cache.clear()
+		return self._lazy_verb_index
+
+	def _get_available_verbs(self, recipe_db: dict[str, Any], visible_tags: frozenset[str]) -> tuple[str, str, frozenset[str]]:
+		verb_index = self._get_verb_index(recipe_db)
+		cached = self._available_verbs_cache.get(visible_tags)
+		if cached is None:
+			# Bounded: distinct tag sets are few in practice, drop everything if that ever stops being true
+			if len(self._available_verbs_cache) >= 512:
+				self._available_verbs_cache.clear()
+			cached = _build_available_verbs(verb_index, visible_tags)
+			self._available_verbs_cache[visible_tags] = cached
+		return cached
+
+	def _lookup_intent(self, inputs: _DecisionInputs) -> str | None:
+		if _LLM_DISABLE_INTENT_CACHE or not inputs.agent_id:
+			return None
+		cached = self._intent_cache.get(inputs.agent_id)
+		if cached is None:
+			return None
+		fingerprint, intent, reuses = cached
+		if fingerprint != inputs.intent_fingerprint or reuses >= int(self.intent_cache_ttl):
+			return None
+		self._intent_cache[inputs.agent_id] = (fingerprint, intent, reuses + 1)
+		if self.debug:
+			print("\n[LLM][Planner] intent cache hit")
+		return intent
+
+	def _store_intent(self, inputs: _DecisionInputs, intent: str) -> None:
+		if _LLM_DISABLE_INTENT_CACHE or not inputs.agent_id:
+			return
+		self._intent_cache[inputs.agent_id] = (inputs.intent_fingerprint, intent, 0)
+
 	def decide(self, perception: dict[str, Any], reason: str, agent_id: str | None = None) -> list[dict[str, Any]]:
-		debug_prompts = str(__import__("os").environ.get("LLM_DEBUG_PROMPTS", "") or "").strip() == "1"
-		agent_id = str(agent_id or perception.get("agent_id", "") or "")
-		visible_entities = list((perception or {}).get("entities", []) or [])
-		interactions = list((perception or {}).get("interactions", []) or [])
-		loc = (perception or {}).get("location", {}) or {}
-		loc_id = str((loc or {}).get("id", "") or "")
-		loc_name = str((loc or {}).get("name", "") or "")
-		tick = (perception or {}).get("tick", None)
+		inputs = self._prepare_decision(perception, reason, agent_id)
+		intent = self._lookup_intent(inputs)
+		if intent is None:
+			intent = self.llm.planner_text(messages=self._planner_messages(inputs), temperature=0.4).strip()
+			self._store_intent(inputs, intent)
+		raw = self.llm.grounder_text(messages=self._grounder_messages(inputs, intent), temperature=0.2).strip()
+		return self._finish_decision(inputs, raw)
+
+	async def decide_async(self, perception: dict[str, Any], reason: str, agent_id: str | None = None) -> list[dict[str, Any]]:
+		"""
+		Same as decide(), but awaits the LLM calls so several agents' decisions can overlap on network I/O.
+		"""
+
+		inputs = self._prepare_decision(perception, reason, agent_id)
+		intent = self._lookup_intent(inputs)
+		if intent is None:
+			intent = (await self.llm.planner_text_async(messages=self._planner_messages(inputs), temperature=0.4)).strip()
+			self._store_intent(inputs, intent)
+		raw = (await self.llm.grounder_text_async(messages=self._grounder_messages(inputs, intent), temperature=0.2)).strip()
+		return self._finish_decision(inputs, raw)
+
+	def batch_decide(self, requests: list[tuple[dict[str, Any], str, str | None]]) -> list[list[dict[str, Any]]]:
+		"""
+		Decide for several agents concurrently: requests is [(perception, reason, agent_id)], result keeps the same order.
+
+		Explanation:
+		- Only valid when the perceptions are independent (all taken from the same world snapshot);
+		  the per-tick loop in AgentControlComponent stays sequential because each agent must see the previous agent's effects.
+		"""
+
+		async def _run() -> list[list[dict[str, Any]]]:
+			return list(await asyncio.gather(*[self.decide_async(p, r, a) for p, r, a in requests]))
+
+		return asyncio.run(_run())
+
+	def _prepare_decision(self, perception: dict[str, Any], reason: str, agent_id: str | None) -> _DecisionInputs:
+		perc = perception or {}
+		agent_id = str(agent_id or _s(perc, "agent_id"))
+		visible_entities = list(perc.get("entities", []) or [])
+		interactions = list(perc.get("interactions", []) or [])
+		loc = perc.get("location", {}) or {}
+		loc_id = _s(loc, "id")
+		loc_name = _s(loc, "name")
+		tick = perc.get("tick", None)
 		tick_str = str(tick) if tick is not None else ""
 
 		recipe_db: dict[str, Any] = {}
 		# Convention: perception can carry recipe_db (Injected by upper layer); otherwise degrade to no available verbs
-		if isinstance((perception or {}).get("recipe_db", None), dict):
-			recipe_db = dict((perception or {}).get("recipe_db") or {})
-
-		available_verbs_list, available_verbs_with_duration, allowed_verbs = _build_available_verbs(recipe_db, visible_entities)
-
-
-		planner_template = _read_text(self.planner_template_path)
+		injected_recipe_db = perc.get("recipe_db", None)
+		if isinstance(injected_recipe_db, dict):
+			# Read-only: keep the injected reference so the verb index cache can hit by identity
+			recipe_db = injected_recipe_db
+
+		# Visible tag set (n)
+		visible_tags = frozenset(str(t) for e in visible_entities if isinstance(e, dict) for t in (e.get("tags", []) or []))
+		visible_ids = frozenset(_s(e, "id") for e in visible_entities if isinstance(e, dict))
+		available_verbs_list, available_verbs_with_duration, allowed_verbs = self._get_available_verbs(recipe_db, visible_tags)
+		# Shared by planner and grounder prompts: render once per decide(), and only if some template references it
+		template_keys = self._get_template_keys()
+		entities_table = _entities_table(visible_entities) if "visible_entities_table" in template_keys else ""
+		interactions_text = _interactions_text(interactions) if "recent_interactions_text" in template_keys else ""
+
+		# Intent cache key: tick is deliberately left out (it changes every round even when nothing else does)
+		last_interaction_tick = max((int(it.get("tick", 0) or 0) for it in interactions if isinstance(it, dict)), default=-1)
+		intent_fingerprint = hashlib.blake2b(
+			f"{loc_id}|{','.join(sorted(visible_ids))}|{entities_table}|{last_interaction_tick}|{len(interactions)}|{reason}".encode("utf-8"),
+			digest_size=16,
+		).hexdigest()
+
+		planner_template = self._get_planner_template()
 		planner_prompt = _fill_template(
 			planner_template,
 			{
-				"agent_name": str((perception or {}).get("agent_name", "") or agent_id),
-				"personality_summary": str((perception or {}).get("personality_summary", "") or ""),
-				"common_knowledge_summary": str((perception or {}).get("common_knowledge_summary", "") or ""),
+				"agent_name": _s(perc, "agent_name") or agent_id,
+				"personality_summary": _s(perc, "personality_summary"),
+				"common_knowledge_summary": _s(perc, "common_knowledge_summary"),
 				"long_term_memory": "",
 				"mid_term_summary": "",
 				"current_goal": "",
 				"current_plan": "",
-				"current_task_id": str((perception or {}).get("current_task_id", "") or ""),
+				"current_task_id": _s(perc, "current_task_id"),
 				"tick": tick_str,
 				"location_id": loc_id,
 				"location_name": loc_name,
 				"available_verbs_with_duration": available_verbs_with_duration,
-				"visible_entities_table": _entities_table(visible_entities),
-				"recent_interactions_text": _interactions_text(interactions),
+				"visible_entities_table": entities_table,
+				"recent_interactions_text": interactions_text,
 				"last_failure_summary": str(reason or ""),
 				"planner_output_here": "",
 			},
 		)
 
-		if bool(self.debug) and bool(debug_prompts):
+		if self.debug and _LLM_DEBUG_PROMPTS:
 			print("\n[LLM][Planner] system prompt:")
-			print(self.PLANNER_SYSTEM_PROMPT.strip())
+			print(self._PLANNER_SYSTEM_MESSAGE["content"])
 			print("\n[LLM][Planner] user prompt:")
 			print(planner_prompt)
 
-		intent = self.llm.planner_text(
-			messages=[
-				{"role": "system", "content": self.PLANNER_SYSTEM_PROMPT},
-				{"role": "user", "content": planner_prompt},
-			],
-			temperature=0.4,
-		).strip()
-		if bool(self.debug):
+		return _DecisionInputs(
+			planner_prompt=planner_prompt,
+			tick_str=tick_str,
+			loc_id=loc_id,
+			loc_name=loc_name,
+			entities_table=entities_table,
+			interactions_text=interactions_text,
+			available_verbs_list=available_verbs_list,
+			allowed_verbs=allowed_verbs,
+			visible_ids=visible_ids,
+			agent_id=agent_id,
+			intent_fingerprint=intent_fingerprint,
+		)
+
+	def _planner_messages(self, inputs: _DecisionInputs) -> list[dict[str, Any]]:
+		return [
+			self._PLANNER_SYSTEM_MESSAGE,
+			{"role": "user", "content": inputs.planner_prompt},
+		]
+
+	def _grounder_messages(self, inputs: _DecisionInputs, intent: str) -> list[dict[str, Any]]:
+		if self.debug:
 			print("\n[LLM][Planner] intent:")
 			print(intent)
 
-		grounder_template = _read_text(self.grounder_template_path)
+		grounder_template = self._get_grounder_template()
 		grounder_prompt = _fill_template(
 			grounder_template,
 			{
 				"planner_intent_text": intent,
-				"tick": tick_str,
-				"location_id": loc_id,
-				"location_name": loc_name,
-				"visible_entities_table": _entities_table(visible_entities),
-				"available_verbs_list": available_verbs_list,
-				"recent_interactions_text": _interactions_text(interactions),
+				"tick": inputs.tick_str,
+				"location_id": inputs.loc_id,
+				"location_name": inputs.loc_name,
+				"visible_entities_table": inputs.entities_table,
+				"available_verbs_list": inputs.available_verbs_list,
+				"recent_interactions_text": inputs.interactions_text,
 				"verb": "",
 				"target_id": "",
 			},
 		)
 
-		if bool(self.debug) and bool(debug_prompts):
+		if self.debug and _LLM_DEBUG_PROMPTS:
 			print("\n[LLM][Grounder] system prompt:")
-			print(self.GROUNDER_SYSTEM_PROMPT.strip())
+			print(self._GROUNDER_SYSTEM_MESSAGE["content"])
 			print("\n[LLM][Grounder] user prompt:")
 			print(grounder_prompt)
 
-		raw = self.llm.grounder_text(
-			messages=[
-				{"role": "system", "content": self.GROUNDER_SYSTEM_PROMPT},
-				{"role": "user", "content": grounder_prompt},
-			],
-			temperature=0.2,
-		).strip()
-		if bool(self.debug):
+		return [
+			self._GROUNDER_SYSTEM_MESSAGE,
+			{"role": "user", "content": grounder_prompt},
+		]
+
+	def _finish_decision(self, inputs: _DecisionInputs, raw: str) -> list[dict[str, Any]]:
+		if self.debug:
 			print("\n[LLM][Grounder] raw actions:")
 			print(raw)
 
 		actions = self._parse_actions(raw)
-		if bool(self.debug):
+		if self.debug:
 			print("\n[LLM][Grounder] parsed actions:")
 			print(actions)
-		return self._validate_actions(actions, allowed_verbs, visible_entities)
+		return self._validate_actions(actions, inputs.allowed_verbs, inputs.visible_ids)
 
 	def _parse_actions(self, raw: str) -> list[dict[str, Any]]:
 		# Allow model output ```json fenced block```, try best effort extraction
 		s = str(raw or "").strip()
-		if "```" in s:
-			parts = s.split("```")
-			# Select the part containing '['
-			for p in parts:
-				if "[" in p and "]" in p:
-					s = p
-					break
-		s = s.strip()
-		# Remove possible "json" tag line
-		if s.lower().startswith("json"):
-			s = "\n".join(s.splitlines()[1:]).strip()
+		m = _JSON_ARRAY_RE.search(s)
+		if m is None:
+			return []
 
 		try:
-			data = json.loads(s)
+			data = _json.loads(m.group(0))
 		except Exception:
 			return []
 		if not isinstance(data, list):
 			return []
-		out: list[dict[str, Any]] = []
-		for item in data:
-			if isinstance(item, dict):
-				out.append(dict(item))
-		return out
-
-	def _validate_actions(self, actions: list[dict[str, Any]], allowed_verbs: set[str], visible_entities: list[dict[str, Any]]) -> list[dict[str, Any]]:
-		visible_ids: set[str] = set()
-		for e in list(visible_entities or []):
-			if isinstance(e, dict):
-				visible_ids.add(str(e.get("id", "") or ""))
+		return [dict(item) for item in data if isinstance(item, dict)]
 
+	def _validate_actions(self, actions: list[dict[str, Any]], allowed_verbs: frozenset[str], visible_ids: frozenset[str]) -> list[dict[str, Any]]:
 		valid: list[dict[str, Any]] = []
 		for a in list(actions or []):
-			verb = str((a or {}).get("verb", "") or "").strip()
-			target_id = str((a or {}).get("target_id", "") or "").strip()
+			verb = sys.intern(_s(a, "verb").strip())
+			target_id = _s(a, "target_id").strip()
 			if not verb or verb not in allowed_verbs:
 				continue
 			if not target_id or target_id not in visible_ids:
 				continue
 			params = (a or {}).get("parameters", {}) or {}
-			if not isinstance(params, dict):
-				params = {}
-			valid.append({"verb": verb, "target_id": target_id, "parameters": dict(params)})
+			# params is freshly parsed from grounder output (owned here): no defensive copy needed
+			valid.append({"verb": verb, "target_id": target_id, "parameters": params if isinstance(params, dict) else {}})
 		return valid
 
 
-def build_default_llm_provider() -> LLMActionProvider:
+def build_default_llm_provider(recipe_db: dict[str, Any] | None = None) -> LLMActionProvider:
 	"""
 	Construct default two-layer LLM provider with provided model names.
+	If recipe_db is given, its verb index is built here once instead of on the first decision.
 	"""
 
 	client = OpenAICompatClient()
 	llm = DualModelLLM(client=client, planner_model="gemini-3-pro-preview", grounder_model="gemini-3-flash")
-	debug = str(__import__("os").environ.get("DEBUG_LLM", "") or "").strip() == "1"
-	return LLMActionProvider(llm=llm, debug=debug)
+	debug = env_flag("DEBUG_LLM")
+	verb_index = RecipeVerbIndex.from_recipe_db(recipe_db) if recipe_db is not None else None
+	return LLMActionProvider(llm=llm, debug=debug, verb_index=verb_index)
 
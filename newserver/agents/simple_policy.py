@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class SimplePolicyActionProvider:
 	"""
 	Minimal Automatic Policy (For "Automatic Simulation Loop" bootstrapping):
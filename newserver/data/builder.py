@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, fields
 from typing import Any
 
 from ..models.components import (
@@ -24,11 +26,16 @@ from ..models.task import Task
 from ..models.world_state import WorldState
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildResult:
 	world_state: WorldState
 
 
+def _as_str(value: Any) -> str:
+	# JSON strings are already str: skip the str() call for them; None/missing -> ""
+	return value if type(value) is str else str(value or "")
+
+
 def build_world_state(bundle_world: dict[str, Any], entity_templates: dict[str, Any]) -> BuildResult:
 	"""
 	Minimal build logic aligned with Godot `WorldBuilder.gd`:
@@ -43,9 +50,16 @@ def build_world_state(bundle_world: dict[str, Any], entity_templates: dict[str,
 	world_state_data = bundle_world.get("world_state", {})
 	ws.game_time.total_ticks = int(world_state_data.get("current_tick", 0))
 
-	# 1) Register locations first
+	# Record declared parent_container per entity, only for entities that have one (For 2nd pass parent_container correction)
+	parent_id_by_entity_id: dict[str, str] = {}
+	# Reverse index entity_id -> location_id: starts as the declared location, kept in sync by the 2nd pass
+	# (avoids scanning every location per move)
+	location_id_by_entity_id: dict[str, str] = {}
+
+	# 1) + 2) Single pass over locations: register the location, then create and register its entities + Put in location
+	# (An entity snapshot only needs its own location to exist; cross-location references are resolved in the 2nd pass)
 	for loc_data in bundle_world.get("locations", []):
-		loc_id = str(loc_data.get("location_id", "")).strip()
+		loc_id = _as_str(loc_data.get("location_id", "")).strip()
 		if not loc_id:
 			continue
 		loc = Location(
@@ -55,17 +69,6 @@ def build_world_state(bundle_world: dict[str, Any], entity_templates: dict[str,
 		)
 		ws.register_location(loc)
 
-	# 2) Create and register entities + Put in location
-	# Record snapshot and "declared location" for each entity (For 2nd pass parent_container correction)
-	snapshots_by_entity_id: dict[str, dict[str, Any]] = {}
-	declared_location_by_entity_id: dict[str, str] = {}
-
-	for loc_data in bundle_world.get("locations", []):
-		loc_id = str(loc_data.get("location_id", "")).strip()
-		loc = ws.get_location_by_id(loc_id)
-		if loc is None:
-			continue
-
 		for snapshot in loc_data.get("entities", []):
 			template_id = snapshot.get("template_id")
 			instance_id = snapshot.get("instance_id")
@@ -80,31 +83,32 @@ def build_world_state(bundle_world: dict[str, Any], entity_templates: dict[str,
 			ws.register_entity(ent)
 			loc.add_entity_id(ent.entity_id)
 
-			snapshots_by_entity_id[str(ent.entity_id)] = snapshot if isinstance(snapshot, dict) else {}
-			declared_location_by_entity_id[str(ent.entity_id)] = loc_id
+			# entity_id is already str (instance_id is coerced above)
+			location_id_by_entity_id[ent.entity_id] = loc_id
+			parent_id = _as_str(snapshot.get("parent_container", "")).strip()
+			if parent_id:
+				parent_id_by_entity_id[ent.entity_id] = parent_id
 
 			overrides = snapshot.get("component_overrides", {}) or {}
 			apply_component_overrides(ent, overrides)
 
-	# 2.5) 2nd Pass: Handle parent_container (Establish "containment", correct location ownership if needed)
-	for entity_id, snapshot in snapshots_by_entity_id.items():
-		if not isinstance(snapshot, dict):
-			continue
-		parent_id = str(snapshot.get("parent_container", "") or "").strip()
-		if not parent_id:
-			continue
+	# Registries are complete from here on: plain dict lookups for the remaining passes
+	entities = ws.entities
+	locations = ws.locations
 
-		child = ws.get_entity_by_id(entity_id)
+	# 2.5) 2nd Pass: Handle parent_container (Establish "containment", correct location ownership if needed)
+	for entity_id, parent_id in parent_id_by_entity_id.items():
+		child = entities.get(entity_id)
 		if child is None:
 			continue
 
 		# parent can be entity container, or location
-		parent_entity = ws.get_entity_by_id(parent_id)
-		parent_location = ws.get_location_by_id(parent_id)
+		parent_entity = entities.get(parent_id)
+		parent_location = locations.get(parent_id)
 
 		if parent_location is not None:
 			# Put in specific location (Still ID-only, no parent-child node)
-			_current_move_entity_between_locations(ws, entity_id, parent_location.location_id)
+			_current_move_entity_between_locations(ws, entity_id, parent_location.location_id, location_id_by_entity_id)
 			continue
 
 		if parent_entity is not None:
@@ -119,9 +123,12 @@ def build_world_state(bundle_world: dict[str, Any], entity_templates: dict[str,
 			cc.add_entity(child)
 
 			# Correct location ownership: child should belong to parent's location
-			parent_loc = ws.get_location_of_entity(parent_entity.entity_id)
-			if parent_loc is not None:
-				_current_move_entity_between_locations(ws, entity_id, parent_loc.location_id)
+			parent_loc_id = location_id_by_entity_id.get(parent_entity.entity_id, "")
+			if not parent_loc_id:
+				parent_loc = ws.get_location_of_entity(parent_entity.entity_id)
+				parent_loc_id = parent_loc.location_id if parent_loc is not None else ""
+			if parent_loc_id:
+				_current_move_entity_between_locations(ws, entity_id, parent_loc_id, location_id_by_entity_id)
 			continue
 
 		# Parent not found: Ignore but don't crash
@@ -130,24 +137,24 @@ def build_world_state(bundle_world: dict[str, Any], entity_templates: dict[str,
 		continue
 
 	# 2.6) Restore initial tasks from archive
-	for tdata in list(bundle_world.get("tasks", []) or []):
+	# Archives written by our own serializer can set "trusted_archive": true to skip per-field coercion
+	build_task = _build_task_fast if bool(bundle_world.get("trusted_archive", False)) else _build_task_safe
+	for tdata in bundle_world.get("tasks") or ():
 		if not isinstance(tdata, dict):
 			continue
 
-		current_agent_id = str(tdata.get("current_agent_id", "") or "").strip()
-		target_entity_id = str(tdata.get("target_entity_id", tdata.get("host_entity_id", "")) or "").strip()
+		current_agent_id = _as_str(tdata.get("current_agent_id", "")).strip()
+		target_entity_id = _as_str(tdata.get("target_entity_id", tdata.get("host_entity_id", ""))).strip()
 		if not target_entity_id:
 			continue
 
-		target = ws.get_entity_by_id(target_entity_id)
+		target = entities.get(target_entity_id)
 		if target is None:
 			continue
 
-		host_entity = target
-		if current_agent_id:
-			agent = ws.get_entity_by_id(current_agent_id)
-			if agent is not None:
-				host_entity = agent
+		# Looked up once: decides the host here and receives current_task below
+		agent = entities.get(current_agent_id) if current_agent_id else None
+		host_entity = agent if agent is not None else target
 
 		host = host_entity.get_component("TaskHostComponent")
 		if not isinstance(host, TaskHostComponent):
@@ -158,40 +165,7 @@ def build_world_state(bundle_world: dict[str, Any], entity_templates: dict[str,
 			host = TaskHostComponent()
 			host_entity.add_component("TaskHostComponent", host)
 
-		task_kwargs: dict[str, Any] = {}
-		task_id = str(tdata.get("task_id", "") or "").strip()
-		if task_id:
-			task_kwargs["task_id"] = task_id
-
-		task_kwargs["task_type"] = str(tdata.get("task_type", tdata.get("verb", "")) or "")
-		task_kwargs["action_type"] = str(tdata.get("action_type", "Task") or "Task")
-		task_kwargs["target_entity_id"] = target_entity_id
-		task_kwargs["progress"] = float(tdata.get("progress", 0.0))
-		task_kwargs["required_progress"] = float(tdata.get("required_progress", 1.0))
-		task_kwargs["multiple_entity"] = bool(tdata.get("multiple_entity", False))
-		task_kwargs["task_status"] = str(tdata.get("task_status", "Inactive"))
-
-		assigned = tdata.get("assigned_agent_ids", []) or []
-		if isinstance(assigned, list):
-			task_kwargs["assigned_agent_ids"] = [str(x) for x in assigned]
-
-		params = tdata.get("parameters", {}) or {}
-		if isinstance(params, dict):
-			task_kwargs["parameters"] = dict(params)
-
-		ce = tdata.get("completion_effects", []) or []
-		if isinstance(ce, list):
-			task_kwargs["completion_effects"] = [x for x in ce if isinstance(x, dict)]
-
-		task_kwargs["progressor_id"] = str(tdata.get("progressor_id", "") or "")
-		pp = tdata.get("progressor_params", {}) or {}
-		if isinstance(pp, dict):
-			task_kwargs["progressor_params"] = dict(pp)
-		te = tdata.get("tick_effects", []) or []
-		if isinstance(te, list):
-			task_kwargs["tick_effects"] = [x for x in te if isinstance(x, dict)]
-
-		task = Task(**task_kwargs)
+		task = build_task(tdata, target_entity_id)
 		# Attach to host and register to global index
 		try:
 			host.add_task(task)
@@ -202,37 +176,96 @@ def build_world_state(bundle_world: dict[str, Any], entity_templates: dict[str,
 		ws.register_task(task)
 
 		# Optional: Restore an agent's current_task (If archive explicitly specifies)
-		if current_agent_id:
-			agent = ws.get_entity_by_id(current_agent_id)
-			if agent is not None:
-				worker = agent.get_component("WorkerComponent")
-				if isinstance(worker, WorkerComponent):
-					worker.assign_task(task.task_id)
+		if agent is not None:
+			worker = agent.get_component("WorkerComponent")
+			if isinstance(worker, WorkerComponent):
+				worker.assign_task(task.task_id)
 
 	# 3) Minimal initialization (e.g. Creature current_*)
-	for ent in ws.entities.values():
+	for ent in entities.values():
 		ent.ensure_initialized()
 
+	# 4) Locations and containers were filled directly above: derive the reverse indexes once
+	ws.rebuild_entity_indexes()
+
 	return BuildResult(world_state=ws)
 
 
-def create_entity_from_template(template_id: str, instance_id: str, entity_templates: dict[str, Any]) -> Entity:
-	template = entity_templates.get(template_id, {})
-	if not isinstance(template, dict) or not template:
-		raise ValueError(f"template not found: {template_id}")
+def _build_task_safe(tdata: dict[str, Any], target_entity_id: str) -> Task:
+	"""
+	Build a Task from archive data of unknown origin: every field is coerced / filtered defensively.
+	"""
+
+	task_kwargs: dict[str, Any] = {}
+	task_id = _as_str(tdata.get("task_id", "")).strip()
+	if task_id:
+		task_kwargs["task_id"] = task_id
+
+	task_kwargs["task_type"] = _as_str(tdata.get("task_type", tdata.get("verb", "")))
+	task_kwargs["action_type"] = str(tdata.get("action_type", "Task") or "Task")
+	task_kwargs["target_entity_id"] = target_entity_id
+	task_kwargs["progress"] = float(tdata.get("progress", 0.0))
+	task_kwargs["required_progress"] = float(tdata.get("required_progress", 1.0))
+	task_kwargs["multiple_entity"] = bool(tdata.get("multiple_entity", False))
+	task_kwargs["task_status"] = str(tdata.get("task_status", "Inactive"))
+
+	assigned = tdata.get("assigned_agent_ids", []) or []
+	if isinstance(assigned, list):
+		task_kwargs["assigned_agent_ids"] = [str(x) for x in assigned]
+
+	params = tdata.get("parameters", {}) or {}
+	if isinstance(params, dict):
+		task_kwargs["parameters"] = dict(params)
+
+	ce = tdata.get("completion_effects", []) or []
+	if isinstance(ce, list):
+		task_kwargs["completion_effects"] = [x for x in ce if isinstance(x, dict)]
+
+	task_kwargs["progressor_id"] = _as_str(tdata.get("progressor_id", ""))
+	pp = tdata.get("progressor_params", {}) or {}
+	if isinstance(pp, dict):
+		task_kwargs["progressor_params"] = dict(pp)
+	te = tdata.get("tick_effects", []) or []
+	if isinstance(te, list):
+		task_kwargs["tick_effects"] = [x for x in te if isinstance(x, dict)]
+
+	return Task(**task_kwargs)
+
+
+# Task dataclass field names (trusted archive records are passed through as-is for these keys)
+_TASK_FIELDS = frozenset(f.name for f in fields(Task))
 
+
+def _build_task_fast(tdata: dict[str, Any], target_entity_id: str) -> Task:
+	"""
+	Build a Task from a trusted archive (written by our own serializer): no coercion, containers are taken by reference.
+
+	Explanation:
+	- Same defaults as _build_task_safe for missing fields (task_type <- verb, action_type "Task", required_progress 1.0)
+	- The loaded bundle is not reused afterwards, so the Task can own the archive's lists/dicts
+	"""
+
+	task_kwargs = {k: v for k, v in tdata.items() if k in _TASK_FIELDS}
+	if not task_kwargs.get("task_id"):
+		task_kwargs.pop("task_id", None)
+	task_kwargs.setdefault("task_type", tdata.get("verb", ""))
+	task_kwargs.setdefault("action_type", "Task")
+	task_kwargs.setdefault("required_progress", 1.0)
+	task_kwargs["target_entity_id"] = target_entity_id
+	return Task(**task_kwargs)
+
+
+def create_entity_from_template(template_id: str, instance_id: str, entity_templates: dict[str, Any]) -> Entity:
+	# Template validation happens once per template inside _get_template_plan (cache miss only)
+	entity_name, component_plan = _get_template_plan(template_id, entity_templates.get(template_id))
 	ent = Entity(
 		entity_id=instance_id,
 		template_id=template_id,
-		entity_name=str(template.get("name", "Unnamed Entity")),
+		entity_name=entity_name,
 	)
 
-	components_data = template.get("components", {}) or {}
-	if not isinstance(components_data, dict):
-		components_data = {}
-
-	for comp_name, comp_data in components_data.items():
-		ent.add_component(comp_name, _build_component(comp_name, comp_data))
+	for comp_name, build, comp_data in component_plan:
+		ent.add_component(comp_name, build(comp_data))
 
 	# If agent, inject WorkerComponent by default (Migration data might not declare yet)
 	# Intent: Let IdleRule judge based on current_task_id; Necessity: You want "Decision rights only when no current_task"
@@ -242,88 +275,207 @@ def create_entity_from_template(template_id: str, instance_id: str, entity_templ
 	return ent
 
 
-def _build_component(component_name: str, comp_data: Any):
+# template_id -> (template dict, entity_name, [(component name, builder, component data)])
+# The template dict is kept in the entry and checked by identity, so a different bundle reusing a template_id rebuilds the plan.
+_TEMPLATE_PLANS: dict[str, tuple[dict[str, Any], str, tuple[tuple[str, Callable[[Any], Any], Any], ...]]] = {}
+
+
+def _get_template_plan(template_id: str, template: Any) -> tuple[str, tuple[tuple[str, Callable[[Any], Any], Any], ...]]:
 	"""
-	Convert migrated components to dataclass; others remain UnknownComponent(dict).
+	Resolve a template's name, component names and builders once; entities of the same template only run the builders.
 	"""
 
-	if component_name == "TagComponent":
-		tags = list((comp_data or {}).get("tags", []))
-		return TagComponent(tags=[str(x) for x in tags])
+	cached = _TEMPLATE_PLANS.get(template_id)
+	if cached is not None and cached[0] is template:
+		return cached[1], cached[2]
 
-	if component_name == "CreatureComponent":
-		d = comp_data or {}
-		return CreatureComponent(
-			max_hp=float(d.get("max_hp", 100.0)),
-			max_energy=float(d.get("max_energy", 100.0)),
-			max_nutrition=float(d.get("max_nutrition", 100.0)),
-		)
+	if not isinstance(template, dict) or not template:
+		raise ValueError(f"template not found: {template_id}")
 
-	if component_name == "AgentComponent":
-		d = comp_data or {}
-		return AgentComponent(
-			agent_name=str(d.get("agent_name", "")),
-			personality_summary=str(d.get("personality_summary", "")),
-			common_knowledge_summary=str(d.get("common_knowledge_summary", "")),
-		)
+	components_data = template.get("components", {}) or {}
+	if not isinstance(components_data, dict):
+		components_data = {}
 
-	# New name: AgentControlComponent
-	# Compatible with old data: LLMControlComponent
-	if component_name == "AgentControlComponent" or component_name == "LLMControlComponent":
-		d = comp_data or {}
-		if not isinstance(d, dict):
-			d = {}
-		return AgentControlComponent(
-			enabled=bool(d.get("enabled", True)),
-			provider_id=str(d.get("provider_id", "") or ""),
-		)
+	plan: list[tuple[str, Callable[[Any], Any], Any]] = []
+	for comp_name, comp_data in components_data.items():
+		# Interned: names parsed from JSON become the same objects as the literals used by get_component("...")
+		comp_name = sys.intern(str(comp_name))
+		plan.append((comp_name, _COMPONENT_BUILDERS.get(comp_name, _build_unknown), comp_data))
 
-	if component_name == "PlayerControlComponent":
-		d = comp_data or {}
-		if not isinstance(d, dict):
-			d = {}
-		return PlayerControlComponent(
-			enabled=bool(d.get("enabled", True)),
-			provider_id=str(d.get("provider_id", "player") or "player"),
-		)
+	entity_name = str(template.get("name", "Unnamed Entity"))
+	component_plan = tuple(plan)
+	_TEMPLATE_PLANS[template_id] = (template, entity_name, component_plan)
+	return entity_name, component_plan
 
-	if component_name == "LogicControlComponent":
-		d = comp_data or {}
-		if not isinstance(d, dict):
-			d = {}
-		return LogicControlComponent(
-			enabled=bool(d.get("enabled", True)),
-			provider_id=str(d.get("provider_id", "logic") or "logic"),
-		)
 
-	if component_name == "ContainerComponent":
-		d = comp_data or {}
-		slots_data = d.get("slots", {}) or {}
-		slots: dict[str, ContainerSlot] = {}
-		for slot_id, slot_tpl in slots_data.items():
-			cfg = dict(slot_tpl or {})
-			cfg.setdefault("capacity_volume", 999.0)
-			cfg.setdefault("capacity_count", 999)
-			cfg.setdefault("accepted_tags", [])
-			cfg.setdefault("transparent", False)
-			slots[str(slot_id)] = ContainerSlot(config=cfg, items=[])
-		return ContainerComponent(slots=slots)
-
-	if component_name == "DecisionArbiterComponent":
-		d = comp_data or {}
-		if isinstance(d, dict):
-			return DecisionArbiterComponent.from_template_data(d)
-		return DecisionArbiterComponent.from_template_data({})
+def _build_tag(comp_data: Any) -> TagComponent:
+	tags = list((comp_data or {}).get("tags", []))
+	return TagComponent(tags=[str(x) for x in tags])
+
+
+def _build_creature(comp_data: Any) -> CreatureComponent:
+	d = comp_data or {}
+	return CreatureComponent(
+		max_hp=float(d.get("max_hp", 100.0)),
+		max_energy=float(d.get("max_energy", 100.0)),
+		max_nutrition=float(d.get("max_nutrition", 100.0)),
+	)
+
+
+def _build_agent(comp_data: Any) -> AgentComponent:
+	d = comp_data or {}
+	return AgentComponent(
+		agent_name=str(d.get("agent_name", "")),
+		personality_summary=str(d.get("personality_summary", "")),
+		common_knowledge_summary=str(d.get("common_knowledge_summary", "")),
+	)
+
+
+def _build_agent_control(comp_data: Any) -> AgentControlComponent:
+	d = comp_data if isinstance(comp_data, dict) else {}
+	return AgentControlComponent(
+		enabled=bool(d.get("enabled", True)),
+		provider_id=_as_str(d.get("provider_id", "")),
+	)
+
+
+def _build_player_control(comp_data: Any) -> PlayerControlComponent:
+	d = comp_data if isinstance(comp_data, dict) else {}
+	return PlayerControlComponent(
+		enabled=bool(d.get("enabled", True)),
+		provider_id=str(d.get("provider_id", "player") or "player"),
+	)
+
+
+def _build_logic_control(comp_data: Any) -> LogicControlComponent:
+	d = comp_data if isinstance(comp_data, dict) else {}
+	return LogicControlComponent(
+		enabled=bool(d.get("enabled", True)),
+		provider_id=str(d.get("provider_id", "logic") or "logic"),
+	)
+
+
+# Default slot config; template values override these (accepted_tags is a tuple: shared default, only ever read)
+_DEFAULT_SLOT_CFG: dict[str, Any] = {
+	"capacity_volume": 999.0,
+	"capacity_count": 999,
+	"accepted_tags": (),
+	"transparent": False,
+}
+
+
+def _build_container(comp_data: Any) -> ContainerComponent:
+	d = comp_data or {}
+	slots_data = d.get("slots", {}) or {}
+	slots: dict[str, ContainerSlot] = {}
+	for slot_id, slot_tpl in slots_data.items():
+		cfg = {**_DEFAULT_SLOT_CFG, **(slot_tpl or {})}
+		slots[str(slot_id)] = ContainerSlot(config=cfg, items=[])
+	return ContainerComponent(slots=slots)
+
+
+def _build_decision_arbiter(comp_data: Any) -> DecisionArbiterComponent:
+	return DecisionArbiterComponent.from_template_data(comp_data if isinstance(comp_data, dict) else {})
 
-	# Compatible with old Godot name: TaskComponent -> Python: TaskHostComponent
-	if component_name == "TaskComponent" or component_name == "TaskHostComponent":
-		return TaskHostComponent()
 
+def _build_task_host(_comp_data: Any) -> TaskHostComponent:
+	return TaskHostComponent()
+
+
+def _build_unknown(comp_data: Any) -> UnknownComponent:
 	# Unmigrated components (Edible/LLMControl/Perception/DecisionArbiter/TaskComponent/...)
 	raw = comp_data if isinstance(comp_data, dict) else {"value": comp_data}
 	return UnknownComponent(data=raw)
 
 
+# Component name -> builder (one dict probe per component instead of an if-chain)
+_COMPONENT_BUILDERS: dict[str, Callable[[Any], Any]] = {
+	"TagComponent": _build_tag,
+	"CreatureComponent": _build_creature,
+	"AgentComponent": _build_agent,
+	# New name: AgentControlComponent
+	# Compatible with old data: LLMControlComponent
+	"AgentControlComponent": _build_agent_control,
+	"LLMControlComponent": _build_agent_control,
+	"PlayerControlComponent": _build_player_control,
+	"LogicControlComponent": _build_logic_control,
+	"ContainerComponent": _build_container,
+	"DecisionArbiterComponent": _build_decision_arbiter,
+	# Compatible with old Godot name: TaskComponent -> Python: TaskHostComponent
+	"TaskComponent": _build_task_host,
+	"TaskHostComponent": _build_task_host,
+}
+
+
+def _build_component(component_name: str, comp_data: Any):
+	"""
+	Convert migrated components to dataclass; others remain UnknownComponent(dict).
+	"""
+
+	return _COMPONENT_BUILDERS.get(component_name, _build_unknown)(comp_data)
+
+
+def _override_unknown(comp: UnknownComponent, comp_patch: dict[str, Any]) -> None:
+	# Shallow merge data
+	comp.data.update(comp_patch)
+
+
+def _override_container(comp: ContainerComponent, comp_patch: dict[str, Any]) -> None:
+	# Support overriding slot config / items (For restoring container content from archive)
+	slots_patch = comp_patch.get("slots", None)
+	if not isinstance(slots_patch, dict):
+		return
+	for slot_id, slot_p in slots_patch.items():
+		if not isinstance(slot_p, dict):
+			continue
+		sid = str(slot_id)
+		if sid not in comp.slots:
+			comp.slots[sid] = ContainerSlot(config={}, items=[])
+		if "config" in slot_p and isinstance(slot_p["config"], dict):
+			comp.slots[sid].config.update(dict(slot_p["config"]))
+		if "items" in slot_p and isinstance(slot_p["items"], list):
+			comp.slots[sid].items = [str(x) for x in slot_p["items"]]
+
+
+def _override_worker(comp: WorkerComponent, comp_patch: dict[str, Any]) -> None:
+	# Override current_task_id (For restoring action rights / what is being done)
+	if "current_task_id" in comp_patch:
+		comp.current_task_id = _as_str(comp_patch.get("current_task_id", ""))
+
+
+def _override_generic(comp: Any, comp_patch: dict[str, Any]) -> None:
+	# Other migrated components: Shallow assignment to same-name fields (No deep semantics)
+	for k, v in comp_patch.items():
+		if hasattr(comp, k):
+			try:
+				setattr(comp, k, v)
+			except Exception:
+				pass
+
+
+# Component class -> override handler (one dict probe instead of an isinstance chain)
+_OVERRIDE_HANDLERS: dict[type, Callable[[Any, dict[str, Any]], None]] = {
+	UnknownComponent: _override_unknown,
+	ContainerComponent: _override_container,
+	WorkerComponent: _override_worker,
+}
+
+
+def _get_override_handler(cls: type) -> Callable[[Any, dict[str, Any]], None]:
+	handler = _OVERRIDE_HANDLERS.get(cls)
+	if handler is not None:
+		return handler
+	# Explanation: subclasses keep isinstance semantics; resolve via MRO once, then cache under the concrete class.
+	handler = _override_generic
+	for base in cls.__mro__[1:]:
+		found = _OVERRIDE_HANDLERS.get(base)
+		if found is not None:
+			handler = found
+			break
+	_OVERRIDE_HANDLERS[cls] = handler
+	return handler
+
+
 def apply_component_overrides(entity: Entity, overrides: dict[str, Any]) -> None:
 	"""
 	MVP Override Strategy: If component is UnknownComponent, shallow merge dict directly;
@@ -337,61 +489,37 @@ def apply_component_overrides(entity: Entity, overrides: dict[str, Any]) -> None
 	for comp_name, comp_patch in (overrides or {}).items():
 		if not isinstance(comp_patch, dict):
 			continue
+		comp_name = sys.intern(str(comp_name))
 
 		comp = entity.get_component(comp_name)
 		if comp is None:
 			continue
 
-		# 1) UnknownComponent: Shallow merge data
-		if isinstance(comp, UnknownComponent):
-			comp.data.update(comp_patch)
-			continue
-
-		# 2) ContainerComponent: Support overriding slot config / items (For restoring container content from archive)
-		if isinstance(comp, ContainerComponent):
-			slots_patch = comp_patch.get("slots", None)
-			if isinstance(slots_patch, dict):
-				for slot_id, slot_p in slots_patch.items():
-					if not isinstance(slot_p, dict):
-						continue
-					sid = str(slot_id)
-					if sid not in comp.slots:
-						comp.slots[sid] = ContainerSlot(config={}, items=[])
-					if "config" in slot_p and isinstance(slot_p["config"], dict):
-						comp.slots[sid].config.update(dict(slot_p["config"]))
-					if "items" in slot_p and isinstance(slot_p["items"], list):
-						comp.slots[sid].items = [str(x) for x in slot_p["items"]]
-			continue
-
-		# 3) WorkerComponent: Override current_task_id (For restoring action rights / what is being done)
-		if isinstance(comp, WorkerComponent):
-			if "current_task_id" in comp_patch:
-				comp.current_task_id = str(comp_patch.get("current_task_id", "") or "")
-			continue
-
-		# 4) Other migrated components: Shallow assignment to same-name fields (No deep semantics)
-		for k, v in comp_patch.items():
-			if hasattr(comp, k):
-				try:
-					setattr(comp, k, v)
-				except Exception:
-					pass
+		_get_override_handler(type(comp))(comp, comp_patch)
 
 
 def _create_default_container_component() -> ContainerComponent:
 	# Default slot named "main"
-	cfg = {
-		"capacity_volume": 999.0,
-		"capacity_count": 999,
-		"accepted_tags": [],
-		"transparent": False,
-	}
-	return ContainerComponent(slots={"main": ContainerSlot(config=cfg, items=[])})
-
-
-def _current_move_entity_between_locations(ws: WorldState, entity_id: str, to_location_id: str) -> None:
-	# Remove from all locations then add to target location (Fault tolerance priority)
-	for loc in ws.locations.values():
-		if entity_id in loc.entities_in_location and str(loc.location_id) != str(to_location_id):
-			loc.remove_entity_id(entity_id)
+	return ContainerComponent(slots={"main": ContainerSlot(config=dict(_DEFAULT_SLOT_CFG), items=[])})
+
+
+def _current_move_entity_between_locations(
+	ws: WorldState,
+	entity_id: str,
+	to_location_id: str,
+	location_id_by_entity_id: dict[str, str] | None = None,
+) -> None:
+	to_location_id = str(to_location_id)
+	from_location_id = (location_id_by_entity_id or {}).get(entity_id, None)
+	if from_location_id is None:
+		# Not indexed: remove from all locations then add to target location (Fault tolerance priority)
+		for loc in ws.locations.values():
+			if entity_id in loc.entities_in_location and str(loc.location_id) != to_location_id:
+				loc.remove_entity_id(entity_id)
+	elif from_location_id != to_location_id:
+		from_loc = ws.get_location_by_id(from_location_id)
+		if from_loc is not None:
+			from_loc.remove_entity_id(entity_id)
 	ws.ensure_entity_in_location(entity_id, to_location_id)
+	if location_id_by_entity_id is not None and to_location_id in ws.locations:
+		location_id_by_entity_id[entity_id] = to_location_id
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import mmap
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+	# Optional: faster bundle parsing; stdlib json is used when orjson is not installed
+	import orjson
+except ImportError:
+	orjson = None
+
 
 @dataclass
 class DataBundle:
@@ -17,17 +28,43 @@ class DataBundle:
 	world: dict[str, Any]
 
 
+# Below this many entity files, thread startup costs more than the overlapped reads save
+_PARALLEL_LOAD_MIN_FILES = 4
+
+
+# Files at least this large are parsed from a read-only mmap (no private bytes copy of the whole file)
+_MMAP_MIN_BYTES = 1 << 20
+
+
 def load_json(path: Path) -> Any:
-	with path.open("r", encoding="utf-8") as f:
-		return json.load(f)
+	if orjson is None:
+		with path.open("r", encoding="utf-8") as f:
+			return json.load(f)
+	with path.open("rb") as f:
+		if os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+			with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+				# memoryview must be released before the mmap closes
+				with memoryview(mm) as view:
+					return _parse_json_bytes(view)
+		return _parse_json_bytes(f.read())
 
 
-def load_data_bundle(project_root: Path) -> DataBundle:
+def _parse_json_bytes(buf: bytes | memoryview) -> Any:
+	try:
+		return orjson.loads(buf)
+	except orjson.JSONDecodeError:
+		# orjson is stricter (e.g. NaN / big ints): let stdlib json parse it or raise its usual error
+		return json.loads(bytes(buf).decode("utf-8"))
+
+
+def load_data_bundle(project_root: Path, use_cache: bool = True) -> DataBundle:
 	"""
 	Read JSON from Data directory.
 	project_root:
 	- Can be "Repo/Godot Project Root" (Has Data/ under it)
 	- Can also pass Data/ directory directly
+	use_cache:
+	- Reuse Data/.cache/bundle-<fingerprint>.pkl when no input file changed (mtime/size of every input JSON)
 	"""
 
 	data_dir = project_root
@@ -38,6 +75,15 @@ def load_data_bundle(project_root: Path) -> DataBundle:
 	else:
 		raise FileNotFoundError(f"Data directory not found under: {project_root}")
 	entities_dir = data_dir / "Entities"
+	paths = _list_json_files(entities_dir)
+
+	cache_path: Path | None = None
+	if use_cache:
+		cache_path = _bundle_cache_path(data_dir, [data_dir / "World.json", data_dir / "Recipes.json", *paths])
+		if cache_path is not None:
+			cached = _read_bundle_cache(cache_path)
+			if cached is not None:
+				return cached
 
 	world = load_json(data_dir / "World.json")
 	recipes = load_json(data_dir / "Recipes.json")
@@ -45,14 +91,71 @@ def load_data_bundle(project_root: Path) -> DataBundle:
 	# Automatically load Entities/*.json and merge
 	# Consistent with Godot DataManager.merge: Later loaded overwrites earlier loaded for same-name keys
 	entity_templates: dict[str, Any] = {}
-	for p in sorted(list(entities_dir.glob("*.json"))):
-		data = load_json(p)
+	if len(paths) > _PARALLEL_LOAD_MIN_FILES:
+		# Reads overlap across worker threads; map() keeps sorted order, merge stays in this thread
+		with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+			loaded = list(pool.map(load_json, paths))
+	else:
+		loaded = [load_json(p) for p in paths]
+	for data in loaded:
 		if isinstance(data, dict):
 			entity_templates.update(data)
 
-	return DataBundle(
+	bundle = DataBundle(
 		entity_templates=entity_templates,
 		recipes=recipes,
 		world=world,
 	)
+	if cache_path is not None:
+		_write_bundle_cache(cache_path, bundle)
+	return bundle
+
+
+def _list_json_files(directory: Path) -> list[Path]:
+	# One scandir pass: DirEntry carries the file type, so no extra stat per entry (sorted for deterministic merge order)
+	try:
+		with os.scandir(directory) as it:
+			names = sorted(e.name for e in it if e.name.endswith(".json") and e.is_file())
+	except FileNotFoundError:
+		return []
+	return [directory / name for name in names]
+
+
+def _bundle_cache_path(data_dir: Path, inputs: list[Path]) -> Path | None:
+	# Fingerprint: (name, mtime_ns, size) of every input; any edit/add/remove yields a different cache file
+	h = hashlib.blake2b(digest_size=16)
+	for p in inputs:
+		try:
+			st = p.stat()
+		except OSError:
+			# Missing input: no cache, let the normal load path raise its usual error
+			return None
+		h.update(f"{p.relative_to(data_dir).as_posix()}|{st.st_mtime_ns}|{st.st_size}\n".encode("utf-8"))
+	return data_dir / ".cache" / f"bundle-{h.hexdigest()}.pkl"
+
+
+def _read_bundle_cache(cache_path: Path) -> DataBundle | None:
+	try:
+		with cache_path.open("rb") as f:
+			bundle = pickle.load(f)
+	except Exception:
+		# Missing / stale format / corrupted: fall back to parsing JSON
+		return None
+	return bundle if isinstance(bundle, DataBundle) else None
+
+
+def _write_bundle_cache(cache_path: Path, bundle: DataBundle) -> None:
+	# Best effort: a read-only data directory just means no cache
+	try:
+		cache_path.parent.mkdir(parents=True, exist_ok=True)
+		tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+		with tmp_path.open("wb") as f:
+			pickle.dump(bundle, f, protocol=5)
+		os.replace(tmp_path, cache_path)
+		# Only the current fingerprint is ever read again: drop caches of older inputs
+		for old in cache_path.parent.glob("bundle-*.pkl"):
+			if old != cache_path:
+				old.unlink(missing_ok=True)
+	except OSError:
+		pass
 
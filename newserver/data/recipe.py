@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class RecipeSpec:
+	"""
+	Task-facing part of a recipe, normalized once per recipe (CreateTask only copies these fields onto the Task).
+
+	Explanation:
+	- Same rules CreateTask applied per call: non-dict effects dropped, progression from recipe["progression"]
+	  then process["progression"]
+	- progressor_params is shared by every task of the recipe: progressors only read it
+	"""
+
+	required_progress: float = 1.0
+	completion_effects: tuple[dict[str, Any], ...] = ()
+	progressor_id: str = ""
+	progressor_params: dict[str, Any] = field(default_factory=dict)
+	tick_effects: tuple[dict[str, Any], ...] = ()
+
+	@classmethod
+	def from_recipe(cls, recipe: dict[str, Any]) -> RecipeSpec:
+		process = recipe.get("process", {}) or {}
+		completion_effects = tuple(x for x in (recipe.get("outputs", []) or []) if isinstance(x, dict))
+
+		# Progressor config: Prioritize recipe["progression"], then process["progression"]
+		prog = recipe.get("progression", None)
+		if prog is None:
+			prog = process.get("progression", {}) or {}
+
+		progressor_id = ""
+		progressor_params: dict[str, Any] = {}
+		tick_effects: tuple[dict[str, Any], ...] = ()
+		if isinstance(prog, dict):
+			progressor_id = str(prog.get("progressor", prog.get("progressor_id", "")) or "")
+			params = prog.get("params", {}) or {}
+			if isinstance(params, dict):
+				progressor_params = dict(params)
+			tick_effects = tuple(x for x in (prog.get("tick_effects", []) or []) if isinstance(x, dict))
+
+		return cls(
+			required_progress=float(process.get("required_progress", 1)),
+			completion_effects=completion_effects,
+			progressor_id=progressor_id,
+			progressor_params=progressor_params,
+			tick_effects=tick_effects,
+		)
+
+
+# recipe_id -> (outputs, process, progression, spec)
+# InteractionEngine hands out shallow copies of the recipe (dict(recipe) + "id"), so the nested objects are what stay
+# identical between calls: they are checked by identity, a reloaded / edited recipe rebuilds the spec.
+_RECIPE_SPECS: dict[str, tuple[Any, Any, Any, RecipeSpec]] = {}
+
+
+def get_recipe_spec(recipe: dict[str, Any]) -> RecipeSpec:
+	recipe_id = recipe.get("id")
+	if not recipe_id:
+		return RecipeSpec.from_recipe(recipe)
+
+	outputs = recipe.get("outputs")
+	process = recipe.get("process")
+	progression = recipe.get("progression")
+	cached = _RECIPE_SPECS.get(recipe_id)
+	if cached is not None and cached[0] is outputs and cached[1] is process and cached[2] is progression:
+		return cached[3]
+
+	spec = RecipeSpec.from_recipe(recipe)
+	_RECIPE_SPECS[recipe_id] = (outputs, process, progression, spec)
+	return spec
@@ -0,0 +1,22 @@
+"""
+Environment switches (read-only during a run).
+
+Explanation:
+- Values are memoized: the environment is not expected to change mid-run; call env_flag.cache_clear()/env_str.cache_clear() to re-read.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def env_flag(name: str) -> bool:
+	# Convention: a switch is on only when set to "1"
+	return os.environ.get(name, "").strip() == "1"
+
+
+@lru_cache(maxsize=32)
+def env_str(name: str) -> str:
+	return os.environ.get(name, "").strip()
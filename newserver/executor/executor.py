@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, ClassVar
 from uuid import uuid4
 
-from ..models.components import ContainerComponent, CreatureComponent, TaskHostComponent, WorkerComponent
+# builder only depends on models: importable at module level (No circular dependency with the executor)
+from ..data.builder import create_entity_from_template
+from ..data.recipe import get_recipe_spec
+from ..models.components import CreatureComponent, TaskHostComponent
 from ..models.task import Task
 
 
@@ -24,44 +28,42 @@ class WorldExecutor:
 		effect_type = (effect_data or {}).get("effect")
 		if not effect_type:
 			return [{"type": "ExecutorError", "message": "missing effect type"}]
+		# Normalized once here so handlers/resolvers can use context.get directly
+		# (`is None`, not `or`: an empty dict from the caller must stay the same object, handlers write results into it)
+		if context is None:
+			context = {}
+
+		handler = self._HANDLERS.get(effect_type if type(effect_type) is str else str(effect_type))
+		if handler is None:
+			return [{"type": "ExecutorError", "message": f"unknown effect type: {effect_type}"}]
+		return handler(self, ws, effect_data, context)
+
+	def _resolve_entity_from_ctx(self, ws: Any, ctx: dict[str, Any], key_or_idkey: Any):
+		# ctx is a dict (normalized in execute); keys/IDs from recipes and contexts are already str, coerce only otherwise
+		key = key_or_idkey if type(key_or_idkey) is str else str(key_or_idkey)
+		eid = ctx.get(key if key.endswith("_id") else key + "_id")
+		if not eid:
+			return None
+		return ws.get_entity_by_id(eid if type(eid) is str else str(eid))
 
-		match str(effect_type):
-			case "ModifyProperty":
-				return self._execute_modify_property(ws, effect_data, context)
-			case "CreateEntity":
-				return self._execute_create_entity(ws, effect_data, context)
-			case "DestroyEntity":
-				return self._execute_destroy_entity(ws, effect_data, context)
-			case "TransferEntity":
-				return self._execute_transfer_entity(ws, effect_data, context)
-			case "AddCondition":
-				return self._execute_add_condition(ws, effect_data, context)
-			case "RemoveCondition":
-				return self._execute_remove_condition(ws, effect_data, context)
-			case "ConsumeInputs":
-				return self._execute_consume_inputs(ws, effect_data, context)
-			case "CreateTask":
-				return self._execute_create_task(ws, effect_data, context)
-			case "ProgressTask":
-				return self._execute_progress_task(ws, effect_data, context)
-			case "UpdateTaskStatus":
-				return self._execute_update_task_status(ws, effect_data, context)
-			case "FinishTask":
-				return self._execute_finish_task(ws, effect_data, context)
-			case _:
-				return [{"type": "ExecutorError", "message": f"unknown effect type: {effect_type}"}]
-
-	def _resolve_entity_from_ctx(self, ws: Any, ctx: dict[str, Any], key_or_idkey: str):
-		id_key = key_or_idkey if str(key_or_idkey).endswith("_id") else f"{key_or_idkey}_id"
-		eid = str((ctx or {}).get(id_key, ""))
-		return ws.get_entity_by_id(eid)
-
-	def _resolve_container_or_location_from_ctx(self, ws: Any, ctx: dict[str, Any], key_or_idkey: str):
-		id_key = key_or_idkey if str(key_or_idkey).endswith("_id") else f"{key_or_idkey}_id"
-		id_val = str((ctx or {}).get(id_key, ""))
+	def _resolve_container_or_location_from_ctx(self, ws: Any, ctx: dict[str, Any], key_or_idkey: Any):
+		key = key_or_idkey if type(key_or_idkey) is str else str(key_or_idkey)
+		base = key[:-3] if key.endswith("_id") else key
+		id_val = ctx.get(base + "_id")
+		if not id_val:
+			return None
+		if type(id_val) is not str:
+			id_val = str(id_val)
+		# Optional producer hint "<name>_kind": "entity" | "location" -> only the matching registry is probed
+		kind = ctx.get(base + "_kind")
+		if kind == "location":
+			return ws.get_location_by_id(id_val)
+		if kind == "entity":
+			ent = ws.get_entity_by_id(id_val)
+			return ent if ent is not None and ent.container is not None else None
 		# Container: Entity with ContainerComponent; Location: location_id
 		ent = ws.get_entity_by_id(id_val)
-		if ent is not None and isinstance(ent.get_component("ContainerComponent"), ContainerComponent):
+		if ent is not None and ent.container is not None:
 			return ent
 		loc = ws.get_location_by_id(id_val)
 		if loc is not None:
@@ -69,14 +71,19 @@ class WorldExecutor:
 		return None
 
 	def _execute_modify_property(self, ws: Any, data: dict[str, Any], context: dict[str, Any]) -> list[dict[str, Any]]:
-		target_key = data.get("target")
-		target = self._resolve_entity_from_ctx(ws, context, str(target_key))
+		data_get = data.get
+		target = self._resolve_entity_from_ctx(ws, context, data_get("target"))
 		if target is None:
 			return [{"type": "ExecutorError", "message": "ModifyProperty: target missing"}]
 
-		comp_name = str(data.get("component", ""))
-		prop_name = str(data.get("property", ""))
-		change = float(data.get("change", 0))
+		# Recipe JSON already gives str names: coerce only otherwise; change stays float() (LLM/data may send int)
+		comp_name = data_get("component", "")
+		if type(comp_name) is not str:
+			comp_name = str(comp_name)
+		prop_name = data_get("property", "")
+		if type(prop_name) is not str:
+			prop_name = str(prop_name)
+		change = float(data_get("change", 0))
 
 		comp = target.get_component(comp_name)
 		if comp is None:
@@ -84,11 +91,13 @@ class WorldExecutor:
 
 		# Currently only strictly supports numeric properties of CreatureComponent, other cases to be extended later
 		if isinstance(comp, CreatureComponent):
-			comp.ensure_initialized()
+			if not comp.initialized:
+				comp.ensure_initialized()
 			cur = getattr(comp, prop_name, None)
 			if cur is None:
 				return [{"type": "ExecutorError", "message": f"ModifyProperty: property missing: {prop_name}"}]
-			setattr(comp, prop_name, float(cur) + change)
+			new_value = float(cur) + change
+			setattr(comp, prop_name, new_value)
 			return [
 				{
 					"type": "PropertyModified",
@@ -96,15 +105,16 @@ class WorldExecutor:
 					"component": comp_name,
 					"property": prop_name,
 					"delta": change,
-					"new_value": getattr(comp, prop_name),
+					"new_value": new_value,
 				}
 			]
 
 		# UnknownComponent: Attempt to write to data dict
-		if hasattr(comp, "data") and isinstance(getattr(comp, "data"), dict):
-			cur = comp.data.get(prop_name, 0)
+		comp_data = getattr(comp, "data", None)
+		if isinstance(comp_data, dict):
 			try:
-				comp.data[prop_name] = float(cur) + change
+				new_value = float(comp_data.get(prop_name, 0)) + change
+				comp_data[prop_name] = new_value
 				return [
 					{
 						"type": "PropertyModified",
@@ -112,7 +122,7 @@ class WorldExecutor:
 						"component": comp_name,
 						"property": prop_name,
 						"delta": change,
-						"new_value": comp.data[prop_name],
+						"new_value": new_value,
 					}
 				]
 			except Exception:
@@ -129,17 +139,17 @@ class WorldExecutor:
 		if not isinstance(self.entity_templates, dict):
 			return [{"type": "ExecutorError", "message": "CreateEntity: executor has no entity_templates"}]
 
-		template = self.entity_templates.get(str(template_id), {})
+		if type(template_id) is not str:
+			template_id = str(template_id)
+		template = self.entity_templates.get(template_id, {})
 		if not isinstance(template, dict) or not template:
 			return [{"type": "ExecutorError", "message": f"CreateEntity: template not found: {template_id}"}]
 
 		# Assume existence: RuntimeEntityFactory
 		# Intent: Separate runtime entity creation from load building; Necessity: CreateEntity needs to reuse template component building logic
 		# Currently use minimal strategy: Reuse builder component building semantics (Only build migrated components, others as UnknownComponent)
-		from ..data.builder import create_entity_from_template  # Local import to avoid circular dependency
-
 		new_id = str(data.get("instance_id") or f"{template_id}_{uuid4().hex[:8]}")
-		new_entity = create_entity_from_template(str(template_id), new_id, self.entity_templates)
+		new_entity = create_entity_from_template(template_id, new_id, self.entity_templates)
 		ws.register_entity(new_entity)
 
 		dest_type = str(destination_data.get("type", ""))
@@ -147,16 +157,10 @@ class WorldExecutor:
 
 		placed = False
 		if dest_type == "container":
-			parent = self._resolve_entity_from_ctx(ws, context, str(dest_target_key))
+			parent = self._resolve_entity_from_ctx(ws, context, dest_target_key)
 			if parent is not None:
-				cc = parent.get_component("ContainerComponent")
-				if isinstance(cc, ContainerComponent):
-					if cc.add_entity(new_entity):
-						# Double Indexing: Add to container's location index
-						loc = ws.get_location_of_entity(parent.entity_id)
-						if loc is not None:
-							ws.ensure_entity_in_location(new_entity.entity_id, loc.location_id)
-						placed = True
+				# Container insertion + Double Indexing under the parent's location
+				placed = ws.place_item_in_container(parent, new_entity)
 
 		elif dest_type == "location":
 			agent = self._resolve_entity_from_ctx(ws, context, "agent")
@@ -184,39 +188,69 @@ class WorldExecutor:
 		]
 
 	def _execute_destroy_entity(self, ws: Any, data: dict[str, Any], context: dict[str, Any]) -> list[dict[str, Any]]:
-		target_key = str(data.get("target", "entity_to_destroy"))
-		ent = self._resolve_entity_from_ctx(ws, context, target_key)
+		ent = self._resolve_entity_from_ctx(ws, context, data.get("target", "entity_to_destroy"))
 		if ent is None:
 			return [{"type": "ExecutorError", "message": "DestroyEntity: target missing"}]
 
+		return self._destroy_entities_bulk(ws, (ent.entity_id,))
+
+	def _destroy_entities_bulk(self, ws: Any, root_ids: Iterable[str]) -> list[dict[str, Any]]:
+		"""
+		Destroy root entities and all their container descendants in one pass (DestroyEntity / ConsumeInputs).
+
+		Explanation:
+		- Descendants are walked with an explicit stack, no execute() round-trip per child
+		- Index removal is grouped per location / holder slot (WorldState.unlink_entities), then one pop per entity
+		- Same events as destroying one ID at a time: children before their container; a container's children are
+		  read when it is entered, minus IDs destroyed so far (Those were already unlinked from every container);
+		  an ID destroyed after that read (Listed twice), a repeated root or an unknown ID reports "target missing"
+		"""
+
+		entities = ws.entities
+		destroyed: dict[str, None] = {}
 		events: list[dict[str, Any]] = []
 
-		# 0) If container, recursively destroy children first (Avoid dangling IDs)
-		cc_self = ent.get_component("ContainerComponent")
-		if isinstance(cc_self, ContainerComponent):
-			for child_id in list(cc_self.get_all_item_ids()):
-				events.extend(self.execute(ws, {"effect": "DestroyEntity", "target": "entity_to_destroy"}, {"entity_to_destroy_id": child_id}))
-
-		# 1) Remove from all location indexes
-		for loc in ws.locations.values():
-			if ent.entity_id in loc.entities_in_location:
-				loc.remove_entity_id(ent.entity_id)
-
-		# 2) Remove from all containers (Iterate all ContainerComponent)
-		for holder in ws.entities.values():
-			cc = holder.get_component("ContainerComponent")
-			if isinstance(cc, ContainerComponent):
-				for slot in cc.slots.values():
-					if ent.entity_id in slot.items:
-						slot.items.remove(ent.entity_id)
-
-		# 3) Delete entity itself
-		ws.entities.pop(ent.entity_id, None)
-		events.append({"type": "EntityDestroyed", "entity_id": ent.entity_id})
+		def live_children(node: Any) -> Iterator[str]:
+			cc = node.container
+			if cc is None:
+				return iter(())
+			# Read on entry (Nothing is unlinked until the walk is done, so destroyed IDs are filtered here)
+			return iter([x for x in cc.iter_item_ids() if x not in destroyed])
+
+		for root_id in root_ids:
+			root = entities.get(root_id) if root_id not in destroyed else None
+			if root is None:
+				events.append({"type": "ExecutorError", "message": "DestroyEntity: target missing"})
+				continue
+			# IDs on the current path (A nesting cycle reports "target missing" instead of looping)
+			active = {root_id}
+			stack: list[tuple[str, Iterator[str]]] = [(root_id, live_children(root))]
+			while stack:
+				eid, children = stack[-1]
+				for child_id in children:
+					child = entities.get(child_id) if child_id not in destroyed and child_id not in active else None
+					if child is None:
+						events.append({"type": "ExecutorError", "message": "DestroyEntity: target missing"})
+						continue
+					active.add(child_id)
+					stack.append((child_id, live_children(child)))
+					break
+				else:
+					stack.pop()
+					active.discard(eid)
+					destroyed[eid] = None
+					events.append({"type": "EntityDestroyed", "entity_id": eid})
+
+		# 1) + 2) Remove from location indexes and holding containers (Grouped reverse index lookups)
+		ws.unlink_entities(destroyed)
+		# 3) Delete entities themselves
+		for eid in destroyed:
+			entities.pop(eid, None)
 		return events
 
 	def _execute_transfer_entity(self, ws: Any, data: dict[str, Any], context: dict[str, Any]) -> list[dict[str, Any]]:
 		# Convention: context provides entity_id/source_id/destination_id (Consistent with your Godot version)
+		# Optional: source_kind/destination_kind ("entity" | "location") when the producer already knows the node kind
 		entity_to_move = self._resolve_entity_from_ctx(ws, context, "entity_id")
 		source_node = self._resolve_container_or_location_from_ctx(ws, context, "source_id")
 		dest_node = self._resolve_container_or_location_from_ctx(ws, context, "destination_id")
@@ -224,70 +258,67 @@ class WorldExecutor:
 		if entity_to_move is None or source_node is None or dest_node is None:
 			return [{"type": "ExecutorError", "message": "TransferEntity: missing entity/source/destination"}]
 
-		# Source/Target location (For cross-location cascading transfer)
-		source_loc = None
-		dest_loc = None
-		if hasattr(source_node, "location_id"):
-			source_loc = source_node
-		else:
-			source_loc = ws.get_location_of_entity(getattr(source_node, "entity_id", ""))
-		if hasattr(dest_node, "location_id"):
-			dest_loc = dest_node
-		else:
-			dest_loc = ws.get_location_of_entity(getattr(dest_node, "entity_id", ""))
+		eid = entity_to_move.entity_id
+		src_is_loc = hasattr(source_node, "location_id")
+		dst_is_loc = hasattr(dest_node, "location_id")
 
-		cross_location = False
-		if source_loc is not None and dest_loc is not None:
-			cross_location = str(source_loc.location_id) != str(dest_loc.location_id)
+		# Source/Target location (For cross-location cascading transfer)
+		source_loc = source_node if src_is_loc else ws.get_location_of_entity(source_node.entity_id)
+		dest_loc = dest_node if dst_is_loc else ws.get_location_of_entity(dest_node.entity_id)
+		cross_location = source_loc is not None and dest_loc is not None and source_loc.location_id != dest_loc.location_id
 
-		# 1) Remove from source
-		if hasattr(source_node, "location_id"):
+		# 1) + 2) Remove from source, add to destination (One path per source/destination kind)
+		if src_is_loc and dst_is_loc:
+			# location -> location: Only location indexes change
 			if cross_location:
-				source_node.remove_entity_id(entity_to_move.entity_id)
+				ws.ensure_entity_removed_from_location(eid, source_node.location_id)
+			add_ok = ws.ensure_entity_in_location(eid, dest_node.location_id)
+		elif dst_is_loc:
+			# container -> location (Drop)
+			if source_node.container is not None and not ws.remove_item_from_container(source_node, eid):
+				return [{"type": "ExecutorError", "message": "TransferEntity: failed to remove from source container"}]
+			# Double Indexing: a contained item is already listed in its container's location, so a same-location drop
+			# only leaves the container
+			add_ok = ws.ensure_entity_in_location(eid, dest_node.location_id) or (not cross_location and source_loc is dest_node)
 		else:
-			cc = source_node.get_component("ContainerComponent")
-			if isinstance(cc, ContainerComponent):
-				if not cc.remove_entity_by_id(entity_to_move.entity_id):
-					return [{"type": "ExecutorError", "message": "TransferEntity: failed to remove from source container"}]
-
-		# 2) Add to destination
-		add_ok = False
-		if hasattr(dest_node, "location_id"):
-			add_ok = bool(dest_node.add_entity_id(entity_to_move.entity_id))
-		else:
-			cc = dest_node.get_component("ContainerComponent")
-			if isinstance(cc, ContainerComponent):
-				add_ok = bool(cc.add_entity(entity_to_move))
-				if add_ok and dest_loc is not None:
-					ws.ensure_entity_in_location(entity_to_move.entity_id, dest_loc.location_id)
+			# location -> container (Pick up) / container -> container
+			if src_is_loc:
+				if cross_location:
+					ws.ensure_entity_removed_from_location(eid, source_node.location_id)
+			elif source_node.container is not None and not ws.remove_item_from_container(source_node, eid):
+				return [{"type": "ExecutorError", "message": "TransferEntity: failed to remove from source container"}]
+			add_ok = dest_node.container is not None and ws.add_item_to_container(dest_node, entity_to_move)
+			if add_ok and dest_loc is not None:
+				ws.ensure_entity_in_location(eid, dest_loc.location_id)
 
 		if not add_ok:
 			return [{"type": "ExecutorError", "message": "TransferEntity: failed to add to destination"}]
 
 		# 3) Cross-location cascading transfer (Container entity must bring descendants)
-		if cross_location and source_loc is not None and dest_loc is not None:
-			ids_to_move = [entity_to_move.entity_id]
-			cc = entity_to_move.get_component("ContainerComponent")
-			if isinstance(cc, ContainerComponent):
-				ids_to_move.extend(ws.collect_descendant_item_ids(entity_to_move.entity_id))
+		if cross_location:
+			ids_to_move = [eid]
+			if entity_to_move.container is not None:
+				ids_to_move.extend(ws.collect_descendant_item_ids(eid))
 			ws.move_ids_between_locations(ids_to_move, source_loc.location_id, dest_loc.location_id)
 
-		return [{"type": "EntityTransferred", "entity_id": entity_to_move.entity_id}]
+		return [{"type": "EntityTransferred", "entity_id": eid}]
 
 	def _get_or_create_conditions_list(self, entity: Any) -> list[str] | None:
 		comp = entity.get_component("ConditionComponent")
 		if comp is None:
 			return None
-		if hasattr(comp, "data") and isinstance(getattr(comp, "data"), dict):
-			comp.data.setdefault("conditions", [])
-			if isinstance(comp.data["conditions"], list):
-				return comp.data["conditions"]
+		# Stays a JSON list (UnknownComponent data is raw archive data; order is kept for output)
+		comp_data = getattr(comp, "data", None)
+		if isinstance(comp_data, dict):
+			conditions = comp_data.setdefault("conditions", [])
+			if isinstance(conditions, list):
+				return conditions
 		return None
 
 	def _execute_add_condition(self, ws: Any, data: dict[str, Any], context: dict[str, Any]) -> list[dict[str, Any]]:
 		target_key = data.get("target")
 		condition_id = data.get("condition_id")
-		target = self._resolve_entity_from_ctx(ws, context, str(target_key))
+		target = self._resolve_entity_from_ctx(ws, context, target_key)
 		if target is None or not condition_id:
 			return [{"type": "ExecutorError", "message": "AddCondition: missing target or condition_id"}]
 
@@ -303,7 +334,7 @@ class WorldExecutor:
 	def _execute_remove_condition(self, ws: Any, data: dict[str, Any], context: dict[str, Any]) -> list[dict[str, Any]]:
 		target_key = data.get("target")
 		condition_id = data.get("condition_id")
-		target = self._resolve_entity_from_ctx(ws, context, str(target_key))
+		target = self._resolve_entity_from_ctx(ws, context, target_key)
 		if target is None or not condition_id:
 			return [{"type": "ExecutorError", "message": "RemoveCondition: missing target or condition_id"}]
 
@@ -312,34 +343,34 @@ class WorldExecutor:
 			return [{"type": "ExecutorError", "message": "RemoveCondition: ConditionComponent missing (not migrated yet)"}]
 
 		cid = str(condition_id)
-		if cid in cond_list:
+		# One scan instead of membership test + remove
+		try:
 			cond_list.remove(cid)
+		except ValueError:
+			pass
 		return [{"type": "ConditionRemoved", "entity_id": target.entity_id, "condition_id": cid}]
 
 	def _execute_consume_inputs(self, ws: Any, data: dict[str, Any], context: dict[str, Any]) -> list[dict[str, Any]]:
-		ids = (context or {}).get("entities_for_consumption_ids", []) or []
-		events: list[dict[str, Any]] = []
-		for eid in list(ids):
-			events.extend(self.execute(ws, {"effect": "DestroyEntity", "target": "entity_to_destroy"}, {"entity_to_destroy_id": str(eid)}))
-		return events
+		ids = context.get("entities_for_consumption_ids", []) or []
+		# One bulk destroy for the whole batch instead of a DestroyEntity round-trip per ID
+		# (root_ids is iterated once and never mutated: a generator, no copied list)
+		return self._destroy_entities_bulk(ws, (eid if type(eid) is str else str(eid) for eid in ids))
 
 	def _execute_create_task(self, ws: Any, data: dict[str, Any], context: dict[str, Any]) -> list[dict[str, Any]]:
 		target = self._resolve_entity_from_ctx(ws, context, "target")
 		if target is None:
 			return [{"type": "ExecutorError", "message": "CreateTask: target missing"}]
-		recipe = (context or {}).get("recipe", {}) or {}
+		recipe = context.get("recipe", {}) or {}
 		if not isinstance(recipe, dict) or not recipe:
 			return [{"type": "ExecutorError", "message": "CreateTask: recipe missing in context"}]
 
-		agent_id = str((context or {}).get("agent_id", "") or "")
+		agent_id = str(context.get("agent_id", "") or "")
 		agent = ws.get_entity_by_id(agent_id) if agent_id else None
 		host_entity = agent if agent is not None else target
 
-		host = host_entity.get_component("TaskHostComponent")
-		if not isinstance(host, TaskHostComponent):
-			# Compatible with old name: TaskComponent (Might still be called this during migration)
-			host = host_entity.get_component("TaskComponent")
-		if not isinstance(host, TaskHostComponent):
+		# Entity.task_host also covers the old name TaskComponent (Might still be called this during migration)
+		host = host_entity.task_host
+		if host is None:
 			host = TaskHostComponent()
 			try:
 				host_entity.add_component("TaskHostComponent", host)
@@ -349,20 +380,13 @@ class WorldExecutor:
 		verb = str(recipe.get("verb", ""))
 		task = Task(task_type=verb, target_entity_id=target.entity_id)
 		task.action_type = "Task"
-		process = recipe.get("process", {}) or {}
-		task.required_progress = float(process.get("required_progress", 1))
-		task.completion_effects = [x for x in (recipe.get("outputs", []) or []) if isinstance(x, dict)]
-
-		# Progressor config: Prioritize recipe["progression"], then process["progression"]
-		prog = recipe.get("progression", None)
-		if prog is None:
-			prog = process.get("progression", {}) or {}
-		if isinstance(prog, dict):
-			task.progressor_id = str(prog.get("progressor", prog.get("progressor_id", "")) or "")
-			params = prog.get("params", {}) or {}
-			if isinstance(params, dict):
-				task.progressor_params = dict(params)
-			task.tick_effects = [x for x in (prog.get("tick_effects", []) or []) if isinstance(x, dict)]
+		# Task fields normalized once per recipe, not per task
+		spec = get_recipe_spec(recipe)
+		task.required_progress = spec.required_progress
+		task.completion_effects = list(spec.completion_effects)
+		task.progressor_id = spec.progressor_id
+		task.progressor_params = spec.progressor_params
+		task.tick_effects = list(spec.tick_effects)
 
 		host.add_task(task)
 		ws.register_task(task)
@@ -372,8 +396,8 @@ class WorldExecutor:
 
 		# If context provides agent_id, assign task to that agent by default, and occupy action rights (WorkerComponent.current_task_id)
 		if agent is not None:
-			worker = agent.get_component("WorkerComponent")
-			if isinstance(worker, WorkerComponent):
+			worker = agent.worker
+			if worker is not None:
 				try:
 					worker.assign_task(task.task_id)
 				except Exception:
@@ -386,9 +410,11 @@ class WorldExecutor:
 		return events
 
 	def _execute_progress_task(self, ws: Any, data: dict[str, Any], context: dict[str, Any]) -> list[dict[str, Any]]:
-		task_id = str(data.get("task_id") or (context or {}).get("task_id", "") or "")
+		task_id = data.get("task_id") or context.get("task_id", "") or ""
+		if type(task_id) is not str:
+			task_id = str(task_id)
 		delta = float(data.get("delta", 0.0))
-		task = ws.get_task_by_id(task_id) if hasattr(ws, "get_task_by_id") else None
+		task = ws.get_task_by_id(task_id)
 
 		if task is None:
 			return [{"type": "ExecutorError", "message": f"ProgressTask: task not found {task_id}"}]
@@ -405,9 +431,11 @@ class WorldExecutor:
 		]
 
 	def _execute_update_task_status(self, ws: Any, data: dict[str, Any], context: dict[str, Any]) -> list[dict[str, Any]]:
-		task_id = str(data.get("task_id") or (context or {}).get("task_id", "") or "")
+		task_id = data.get("task_id") or context.get("task_id", "") or ""
+		if type(task_id) is not str:
+			task_id = str(task_id)
 		new_status = str(data.get("status", "")).strip()
-		task = ws.get_task_by_id(task_id) if hasattr(ws, "get_task_by_id") else None
+		task = ws.get_task_by_id(task_id)
 
 		if task is None:
 			return [{"type": "ExecutorError", "message": f"UpdateTaskStatus: task not found {task_id}"}]
@@ -424,7 +452,9 @@ class WorldExecutor:
 		]
 
 	def _execute_finish_task(self, ws: Any, data: dict[str, Any], context: dict[str, Any]) -> list[dict[str, Any]]:
-		task_id = str((context or {}).get("task_id", ""))
+		task_id = context.get("task_id", "")
+		if type(task_id) is not str:
+			task_id = str(task_id)
 		task = ws.get_task_by_id(task_id)
 		if task is None:
 			return [{"type": "ExecutorError", "message": "FinishTask: task not found"}]
@@ -439,29 +469,50 @@ class WorldExecutor:
 		# Execute completion effects (Prioritize completion_effects solidified in task)
 		effects = list(task.completion_effects or [])
 		if not effects:
-			recipe = (context or {}).get("recipe", {}) or {}
+			recipe = context.get("recipe", {}) or {}
 			if isinstance(recipe, dict):
 				effects = [x for x in (recipe.get("outputs", []) or []) if isinstance(x, dict)]
 
+		# Direct handler lookup per effect (In recipe order); anything without a known str effect type goes through
+		# execute() for its error envelope
+		handlers = self._HANDLERS
 		events: list[dict[str, Any]] = []
 		for eff in effects:
-			events.extend(self.execute(ws, eff, context))
+			effect_type = eff.get("effect") if isinstance(eff, dict) else None
+			handler = handlers.get(effect_type) if type(effect_type) is str else None
+			if handler is None:
+				events.extend(self.execute(ws, eff, context))
+			else:
+				events.extend(handler(self, ws, eff, context))
 
 		# Remove from host + Global unregister
 		host_entity = None
-		agent_id = str((context or {}).get("agent_id", "") or "")
+		agent_id = str(context.get("agent_id", "") or "")
 		if agent_id:
 			host_entity = ws.get_entity_by_id(agent_id)
 		if host_entity is None:
 			host_entity = ws.get_entity_by_id(task.target_entity_id)
 
 		if host_entity is not None:
-			host = host_entity.get_component("TaskHostComponent")
-			if not isinstance(host, TaskHostComponent):
-				host = host_entity.get_component("TaskComponent")
-			if isinstance(host, TaskHostComponent):
+			host = host_entity.task_host
+			if host is not None:
 				host.remove_task(task.task_id)
 
 		ws.unregister_task(task.task_id)
 		events.append({"type": "TaskFinished", "task_id": task.task_id})
 		return events
+
+	# Effect type -> unbound handler (one dict probe per execute() instead of a match over string literals)
+	_HANDLERS: ClassVar[dict[str, Callable[..., list[dict[str, Any]]]]] = {
+		"ModifyProperty": _execute_modify_property,
+		"CreateEntity": _execute_create_entity,
+		"DestroyEntity": _execute_destroy_entity,
+		"TransferEntity": _execute_transfer_entity,
+		"AddCondition": _execute_add_condition,
+		"RemoveCondition": _execute_remove_condition,
+		"ConsumeInputs": _execute_consume_inputs,
+		"CreateTask": _execute_create_task,
+		"ProgressTask": _execute_progress_task,
+		"UpdateTaskStatus": _execute_update_task_status,
+		"FinishTask": _execute_finish_task,
+	}
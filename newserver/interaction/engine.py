@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -14,6 +14,10 @@ class InteractionEngine:
 
 	recipe_db: dict[str, Any]
 
+	# verb -> [(recipe_id, recipe, required target tags)] in recipe_db order (Built on first match; rebuilt if recipe_db is replaced)
+	_recipes_by_verb: dict[Any, list[tuple[str, dict[str, Any], frozenset[str]]]] = field(default_factory=dict, init=False, repr=False)
+	_indexed_recipe_db: Any = field(default=None, init=False, repr=False)
+
 	def process_command(self, ws: Any, agent_id: str, command_data: dict[str, Any]) -> dict[str, Any]:
 		verb = command_data.get("verb")
 		target_id = command_data.get("target_id")
@@ -39,21 +43,37 @@ class InteractionEngine:
 		effects = self._expand_dynamic_outputs(ws, target, recipe.get("outputs", []) or [])
 		return {"status": "success", "effects": effects, "context": context}
 
-	def _find_matching_recipe(self, verb: str, target: Any, params: dict[str, Any]) -> dict[str, Any] | None:
-		for recipe_id, recipe in (self.recipe_db or {}).items():
-			if (recipe or {}).get("verb") != verb:
-				continue
+	def _get_recipes_for_verb(self, verb: str) -> list[tuple[str, dict[str, Any], frozenset[str]]]:
+		recipe_db = self.recipe_db
+		if recipe_db is not self._indexed_recipe_db:
+			by_verb: dict[Any, list[tuple[str, dict[str, Any], frozenset[str]]]] = {}
+			for recipe_id, recipe in (recipe_db or {}).items():
+				if not isinstance(recipe, dict):
+					continue
+				recipe_verb = recipe.get("verb")
+				# Kept beside the recipe (Not written into it: recipe dicts are copied into action contexts and logs)
+				required_tags = frozenset(str(tag) for tag in (recipe.get("target_tags", []) or []))
+				try:
+					by_verb.setdefault(recipe_verb, []).append((recipe_id, recipe, required_tags))
+				except TypeError:
+					# Unhashable verb can never equal a str verb
+					continue
+			self._recipes_by_verb = by_verb
+			self._indexed_recipe_db = recipe_db
+		return self._recipes_by_verb.get(verb, [])
 
-			required_tags = (recipe or {}).get("target_tags", []) or []
-			ok = True
-			for tag in required_tags:
-				if not target.has_tag(str(tag)):
-					ok = False
-					break
-			if not ok:
+	def _find_matching_recipe(self, verb: str, target: Any, params: dict[str, Any]) -> dict[str, Any] | None:
+		# Only recipes of this verb are scanned (First match in recipe_db order, as before)
+		candidates = self._get_recipes_for_verb(verb)
+		if not candidates:
+			return None
+		# Target tags read once per command (Tags are a plain list that may change, so not cached on the entity)
+		target_tags = set(target.get_all_tags())
+		for recipe_id, recipe, required_tags in candidates:
+			if not required_tags <= target_tags:
 				continue
 
-			if "parameter_match" in (recipe or {}):
+			if "parameter_match" in recipe:
 				pm = recipe.get("parameter_match") or {}
 				if pm:
 					key = list(pm.keys())[0]
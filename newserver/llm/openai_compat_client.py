@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import http.client
 import json
 import os
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 
+try:
+	# Optional: faster request/response (de)serialization; stdlib json is used when orjson is not installed
+	import orjson
+except ImportError:
+	orjson = None
 
 
 DEFAULT_BASE_URL = os.environ.get("LLM_BASE_URL", "https://www.packyapi.com/")
@@ -27,6 +36,31 @@ def _join_url(base_url: str, path: str) -> str:
 	return f"{b}/{p}"
 
 
+def _dumps_json(payload: dict[str, Any]) -> bytes:
+	if orjson is not None:
+		try:
+			return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+		except orjson.JSONEncodeError:
+			# e.g. ints beyond 64 bit: let stdlib json encode it or raise its usual error
+			pass
+	return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _loads_json(raw: bytes) -> Any:
+	if orjson is not None:
+		try:
+			# Parsed straight from bytes (No decode pass over the body)
+			return orjson.loads(raw)
+		except orjson.JSONDecodeError:
+			# orjson is stricter (Invalid UTF-8, NaN, ...): fall back to the lenient stdlib path
+			pass
+	return json.loads(raw.decode("utf-8", errors="replace"))
+
+
+# Errors raised when a kept-alive connection was closed by the server between requests
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, ConnectionAbortedError, BrokenPipeError)
+
+
 @dataclass
 class OpenAICompatClient:
 	"""
@@ -34,6 +68,10 @@ class OpenAICompatClient:
 
 	Supported Interfaces:
 	- POST /chat/completions
+
+	Explanation:
+	- Connections are kept alive and reused per thread (TLS handshake only on first request to a host)
+	- When a proxy is configured in the environment, requests go through urllib (Which handles proxies) instead
 	"""
 
 	base_url: str = DEFAULT_BASE_URL
@@ -45,6 +83,79 @@ class OpenAICompatClient:
 	user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
 	extra_headers: dict[str, str] | None = None
 
+	# (scheme, netloc) -> connection, per thread (http.client connections are not thread-safe; async variants use to_thread)
+	_local: threading.local = field(default_factory=threading.local, init=False, repr=False, compare=False)
+
+	def close(self) -> None:
+		"""
+		Close kept-alive connections opened by the calling thread.
+		"""
+
+		conns = getattr(self._local, "conns", None)
+		if not conns:
+			return
+		for conn in conns.values():
+			conn.close()
+		conns.clear()
+
+	def _get_connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+		conns = getattr(self._local, "conns", None)
+		if conns is None:
+			conns = {}
+			self._local.conns = conns
+		conn = conns.get((scheme, netloc))
+		if conn is None:
+			conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+			conn = conn_cls(netloc, timeout=int(self.timeout_seconds))
+			conns[(scheme, netloc)] = conn
+		else:
+			conn.timeout = int(self.timeout_seconds)
+		return conn
+
+	def _post(self, url: str, body: bytes, headers: dict[str, str]) -> tuple[int, str, bytes]:
+		"""
+		POST body and return (status, reason, raw response body); HTTP error statuses are returned, not raised.
+		"""
+
+		parts = urlsplit(url)
+		scheme = parts.scheme.lower()
+		if scheme not in ("http", "https") or (scheme in getproxies() and not proxy_bypass(parts.hostname or "")):
+			try:
+				req = Request(url=url, data=body, headers=headers, method="POST")
+				with urlopen(req, timeout=int(self.timeout_seconds)) as resp:
+					return int(resp.status), str(resp.reason or ""), resp.read()
+			except HTTPError as e:
+				try:
+					err_body = e.read()
+				except Exception:
+					err_body = b""
+				return int(getattr(e, "code", 0) or 0), str(getattr(e, "reason", "") or ""), err_body
+
+		path = parts.path or "/"
+		if parts.query:
+			path = f"{path}?{parts.query}"
+		conn = self._get_connection(scheme, parts.netloc)
+		# Server may drop an idle kept-alive connection: retry once on a fresh one (Not counted as a retry attempt)
+		reused = conn.sock is not None
+		try:
+			conn.request("POST", path, body=body, headers=headers)
+			resp = conn.getresponse()
+		except _STALE_CONNECTION_ERRORS:
+			conn.close()
+			if not reused:
+				raise
+			conn.request("POST", path, body=body, headers=headers)
+			resp = conn.getresponse()
+		except BaseException:
+			conn.close()
+			raise
+		try:
+			# Body must be fully read before the connection can be reused
+			return int(resp.status), str(resp.reason or ""), resp.read()
+		except BaseException:
+			conn.close()
+			raise
+
 	def chat_completions(
 		self,
 		messages: list[dict[str, Any]],
@@ -66,26 +177,36 @@ class OpenAICompatClient:
 		if not str(model or "").strip():
 			raise ValueError("model is required")
 
-		# Most third-party OpenAI-compatible API paths are: {base_url}{api_prefix}/chat/completions
-		prefix = str(self.api_prefix or "").strip() or "/v1"
-		if not prefix.startswith("/"):
-			prefix = f"/{prefix}"
-		url = _join_url(self.base_url, f"{prefix}/chat/completions")
-
+		# payload is serialized right away and never escapes: caller objects are referenced, not copied
 		payload: dict[str, Any] = {
 			"model": str(model),
-			"messages": list(messages),
+			"messages": messages,
 			"temperature": float(temperature),
 		}
 		if max_tokens is not None:
 			payload["max_tokens"] = int(max_tokens)
 		if isinstance(response_format, dict) and response_format:
-			payload["response_format"] = dict(response_format)
+			payload["response_format"] = response_format
 		if isinstance(extra, dict) and extra:
 			# Allow injection of third-party fields (e.g., top_p, presence_penalty, seed, etc.)
-			payload.update(dict(extra))
+			payload.update(extra)
+
+		return self.chat_completions_prepared(_dumps_json(payload))
+
+	def chat_completions_prepared(self, body: bytes) -> dict[str, Any]:
+		"""
+		Send an already serialized /chat/completions request body (UTF-8 JSON) and return full JSON response.
 
-		body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+		Explanation:
+		- For callers resending an identical request: serialize once, send many times
+		- Same retry/backoff and errors as chat_completions
+		"""
+
+		# Most third-party OpenAI-compatible API paths are: {base_url}{api_prefix}/chat/completions
+		prefix = str(self.api_prefix or "").strip() or "/v1"
+		if not prefix.startswith("/"):
+			prefix = f"/{prefix}"
+		url = _join_url(self.base_url, f"{prefix}/chat/completions")
 
 		headers = {
 			"Content-Type": "application/json",
@@ -102,27 +223,22 @@ class OpenAICompatClient:
 		last_err: Exception | None = None
 		for attempt in range(int(self.max_retries) + 1):
 			try:
-				req = Request(url=url, data=body, headers=headers, method="POST")
-				with urlopen(req, timeout=int(self.timeout_seconds)) as resp:
-					raw = resp.read().decode("utf-8", errors="replace")
-					data = json.loads(raw)
+				status, reason, raw_bytes = self._post(url, body, headers)
+				if 200 <= status < 300:
+					data = _loads_json(raw_bytes)
 					if not isinstance(data, dict):
 						raise LLMRequestError("invalid response json: not an object")
 					return data
-			except HTTPError as e:
-				last_err = e
-				try:
-					err_body = e.read().decode("utf-8", errors="replace")
-				except Exception:
-					err_body = ""
-				msg = f"LLM HTTPError {getattr(e, 'code', '')}: {getattr(e, 'reason', '')} body={err_body}"
+
+				err_body = raw_bytes.decode("utf-8", errors="replace")
+				msg = f"LLM HTTPError {status}: {reason} body={err_body}"
+				last_err = LLMRequestError(msg)
 				# 4xx usually not retryable; 5xx/429 retryable
-				code = int(getattr(e, "code", 0) or 0)
-				if code and 400 <= code < 500 and code not in [429]:
-					raise LLMRequestError(msg) from e
+				if status < 500 and status not in [429]:
+					raise last_err
 				if attempt >= int(self.max_retries):
-					raise LLMRequestError(msg) from e
-			except (URLError, TimeoutError, json.JSONDecodeError) as e:
+					raise last_err
+			except (OSError, http.client.HTTPException, json.JSONDecodeError) as e:
 				last_err = e
 				if attempt >= int(self.max_retries):
 					raise LLMRequestError(f"LLM request failed: {e}") from e
@@ -163,6 +279,29 @@ class OpenAICompatClient:
 			content = ""
 		return str(content)
 
+	# --- Async variants (Blocking call runs in a worker thread; default executor threads are reused, and so are their connections) ---
+	async def chat_completions_async(
+		self,
+		messages: list[dict[str, Any]],
+		model: str,
+		temperature: float = 0.2,
+		max_tokens: int | None = None,
+		response_format: dict[str, Any] | None = None,
+		extra: dict[str, Any] | None = None,
+	) -> dict[str, Any]:
+		return await asyncio.to_thread(self.chat_completions, messages, model, temperature, max_tokens, response_format, extra)
+
+	async def chat_text_async(
+		self,
+		messages: list[dict[str, Any]],
+		model: str,
+		temperature: float = 0.2,
+		max_tokens: int | None = None,
+		response_format: dict[str, Any] | None = None,
+		extra: dict[str, Any] | None = None,
+	) -> str:
+		return await asyncio.to_thread(self.chat_text, messages, model, temperature, max_tokens, response_format, extra)
+
 
 def demo_call() -> None:
 	"""
@@ -221,3 +360,27 @@ class DualModelLLM:
 			response_format=response_format,
 		)
 
+	# --- Async variants (planner and grounder calls of different agents can be awaited together with asyncio.gather) ---
+	async def planner_text_async(self, messages: list[dict[str, Any]], temperature: float = 0.4, max_tokens: int | None = None) -> str:
+		return await self.client.chat_text_async(
+			messages=messages,
+			model=str(self.planner_model),
+			temperature=float(temperature),
+			max_tokens=max_tokens,
+		)
+
+	async def grounder_text_async(
+		self,
+		messages: list[dict[str, Any]],
+		temperature: float = 0.2,
+		max_tokens: int | None = None,
+		response_format: dict[str, Any] | None = None,
+	) -> str:
+		return await self.client.chat_text_async(
+			messages=messages,
+			model=str(self.grounder_model),
+			temperature=float(temperature),
+			max_tokens=max_tokens,
+			response_format=response_format,
+		)
+
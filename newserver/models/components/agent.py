@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentComponent:
 	agent_name: str = ""
 	personality_summary: str = ""
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentControlComponent:
 	"""
 	Agent control switch ("Is this entity allowed to be driven by Agent/LLM").
@@ -120,10 +120,11 @@ class AgentControlComponent:
 			# Note: effects/event_log are granular, Planner mainly consumes interactions (recipe/attempt level narrative).
 			perception = perception_system.perceive(ws, agent_id, include_interactions=True)
 			# Inject recipe_db additionally for LLM side (used to generate available verb set; avoid n*m action list).
+			# Passed by reference (read-only on the provider side): lets the provider cache its verb index across decisions.
 			services = getattr(ws, "services", {}) or {}
 			engine = services.get("interaction_engine")
 			if engine is not None and hasattr(engine, "recipe_db") and isinstance(getattr(engine, "recipe_db"), dict):
-				perception["recipe_db"] = dict(getattr(engine, "recipe_db"))
+				perception["recipe_db"] = getattr(engine, "recipe_db")
 
 			# Compatible with different decide signatures: decide(perception, reason) or decide(perception, reason, agent_id)
 			try:
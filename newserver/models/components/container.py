@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerSlot:
 	"""
 	Align with slot structure of Godot `ContainerComponent.gd`: config + items (ID list).
@@ -14,16 +15,23 @@ class ContainerSlot:
 	items: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerComponent:
 	slots: dict[str, ContainerSlot] = field(default_factory=dict)
 
 	def get_all_item_ids(self) -> list[str]:
 		all_ids: list[str] = []
 		for slot in self.slots.values():
-			all_ids.extend(list(slot.items))
+			all_ids.extend(slot.items)
 		return all_ids
 
+	def iter_item_ids(self) -> Iterator[str]:
+		"""
+		Iterate item IDs across slots without building a list (Caller must not add/remove items while iterating).
+		"""
+		for slot in self.slots.values():
+			yield from slot.items
+
 	def has_item_id(self, item_id: str) -> bool:
 		for slot in self.slots.values():
 			if item_id in slot.items:
@@ -31,15 +39,22 @@ class ContainerComponent:
 		return False
 
 	def remove_entity_by_id(self, item_id: str) -> bool:
+		# list.remove does the membership scan itself: one pass per slot instead of `in` + remove
 		for slot in self.slots.values():
-			if item_id in slot.items:
+			try:
 				slot.items.remove(item_id)
-				return True
+			except ValueError:
+				continue
+			return True
 		return False
 
 	def add_entity(self, item_entity: Any, target_slot_id: str = "") -> bool:
+		return bool(self.place_entity(item_entity, target_slot_id))
+
+	def place_entity(self, item_entity: Any, target_slot_id: str = "") -> str:
 		"""
 		Minimal container add logic (aligns with "shape" of Godot's ContainerComponent.add_entity).
+		Returns the slot id the item was placed in ("" on failure; add_entity is the bool form).
 
 		Note:
 		- "Cycle Nesting Detection" is not implemented here (needs access to WorldState descendant collection).
@@ -47,53 +62,50 @@ class ContainerComponent:
 		  Intent: Avoid A containing B and B containing A; Necessity: Must have in complex container systems, otherwise causes infinite loops/index corruption.
 		"""
 		if item_entity is None:
-			return False
+			return ""
 		item_id = str(getattr(item_entity, "entity_id", ""))
 		if not item_id:
-			return False
+			return ""
 
 		if self.has_item_id(item_id):
-			return False
+			return ""
 
+		slot_id = ""
 		slot = None
 		if target_slot_id:
-			slot = self.slots.get(str(target_slot_id))
+			slot_id = str(target_slot_id)
+			slot = self.slots.get(slot_id)
 		if slot is None:
-			slot = self._find_first_available_slot_for(item_entity)
+			slot_id, slot = self._find_first_available_slot_for(item_entity)
 		if slot is None:
-			return False
+			return ""
 
 		slot.items.append(item_id)
-		return True
+		return slot_id
 
 	def _find_first_available_slot_for(self, item_entity: Any):
 		"""
 		Select first available slot: Check capacity_count and accepted_tags (minimal implementation).
 		"""
-		item_tags = []
+		# Set: accepted_tags are tested by membership per slot
+		item_tags: set[str] = set()
 		if hasattr(item_entity, "get_all_tags"):
 			try:
-				item_tags = list(item_entity.get_all_tags())
+				item_tags = set(item_entity.get_all_tags())
 			except Exception:
-				item_tags = []
+				item_tags = set()
 
-		for slot in self.slots.values():
+		for slot_id, slot in self.slots.items():
 			cfg = slot.config or {}
 			cap_count = int(cfg.get("capacity_count", 999))
 			if len(slot.items) >= cap_count:
 				continue
 
-			accepted = list(cfg.get("accepted_tags", []) or [])
-			if accepted:
-				ok = True
-				for t in accepted:
-					if str(t) not in item_tags:
-						ok = False
-						break
-				if not ok:
-					continue
+			accepted = cfg.get("accepted_tags", []) or ()
+			if accepted and not all(str(t) in item_tags for t in accepted):
+				continue
 
-			return slot
+			return slot_id, slot
 
-		return None
+		return "", None
 
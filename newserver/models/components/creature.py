@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class CreatureComponent:
 	"""
 	Minimal implementation: Only keep fields you currently use/will be modified by effects.
@@ -17,11 +17,18 @@ class CreatureComponent:
 	current_energy: float | None = None
 	current_nutrition: float | None = None
 
+	# Set once current_* are filled, so hot callers can skip ensure_initialized() with one attribute read
+	# (Not done in __post_init__: component_overrides may still change max_* after construction)
+	initialized: bool = field(default=False, init=False, repr=False, compare=False)
+
 	def ensure_initialized(self) -> None:
+		if self.initialized:
+			return
 		if self.current_hp is None:
 			self.current_hp = float(self.max_hp)
 		if self.current_energy is None:
 			self.current_energy = float(self.max_energy)
 		if self.current_nutrition is None:
 			self.current_nutrition = float(self.max_nutrition)
+		self.initialized = True
 
@@ -7,7 +7,7 @@ from ...sim.interrupt_rules import IdleRule, LowNutritionRule, InterruptResult
 from .controller_resolver import resolve_enabled_controller_component
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionArbiterComponent:
 	"""
 	Align with Godot `DecisionArbiterComponent.gd`:
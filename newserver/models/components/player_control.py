@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerControlComponent:
 	"""
 	Player Controller (Placeholder implementation).
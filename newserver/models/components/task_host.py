@@ -6,7 +6,7 @@ from typing import Any
 from ..task import Task
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskHostComponent:
 	"""
 	Original Godot name: TaskComponent
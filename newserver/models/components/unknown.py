@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class UnknownComponent:
 	"""
 	Used to hold raw dictionaries for unmigrated components (e.g., Equipment/Condition/Perception/LLMControl).
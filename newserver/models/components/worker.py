@@ -3,10 +3,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
+from ...env import env_flag
 from ...progressors import get_progressor
 
 
-@dataclass
+# Read once at import: per_tick runs for every worker on every tick
+_VERBOSE_EVENTS = env_flag("VERBOSE_EVENTS")
+
+
+@dataclass(slots=True)
 class WorkerComponent:
 	"""
 	Align with core field shape of Godot `WorkerComponent.gd`:
@@ -31,9 +36,10 @@ class WorkerComponent:
 
 	def per_tick(self, _ws: Any, _entity_id: str, _ticks_per_minute: int) -> None:
 		ws = _ws
-		agent_id = str(_entity_id)
+		# Entity IDs are already str: coerce only otherwise (Runs for every agent every tick)
+		agent_id = _entity_id if type(_entity_id) is str else str(_entity_id)
 		ticks = int(_ticks_per_minute)
-		verbose = str(__import__("os").environ.get("VERBOSE_EVENTS", "") or "").strip() == "1"
+		verbose = _VERBOSE_EVENTS
 
 		if not self.has_task():
 			return
@@ -45,7 +51,9 @@ class WorkerComponent:
 			return
 
 		# 1) Advance progress
-		pid = str(getattr(task, "progressor_id", "") or "Linear")
+		pid = getattr(task, "progressor_id", "") or "Linear"
+		if type(pid) is not str:
+			pid = str(pid)
 		progressor = get_progressor(pid)
 		delta = float(progressor.compute_progress_delta(ws, agent_id, task, ticks))
 		
@@ -11,7 +11,9 @@ from .components import (
 	LogicControlComponent,
 	PlayerControlComponent,
 	TagComponent,
+	TaskHostComponent,
 	UnknownComponent,
+	WorkerComponent,
 )
 
 
@@ -39,10 +41,36 @@ class Entity:
 	# component_name -> component_state
 	components: dict[str, ComponentValue] = field(default_factory=dict)
 
+	# Typed handles for the components the executor touches most (Kept in sync by add_component)
+	# Intent: `ent.container` instead of get_component("ContainerComponent") + isinstance on every write
+	container: ContainerComponent | None = field(default=None, init=False, repr=False, compare=False)
+	task_host: TaskHostComponent | None = field(default=None, init=False, repr=False, compare=False)
+	worker: WorkerComponent | None = field(default=None, init=False, repr=False, compare=False)
+
+	def __post_init__(self) -> None:
+		for name, comp in self.components.items():
+			self._bind_typed_component(name, comp)
+
 	def add_component(self, component_name: str, component_value: ComponentValue) -> None:
 		if component_name in self.components:
 			raise ValueError(f"component already exists: {component_name}")
 		self.components[component_name] = component_value
+		self._bind_typed_component(component_name, component_value)
+
+	def _bind_typed_component(self, component_name: str, component_value: Any) -> None:
+		if component_name == "ContainerComponent":
+			if isinstance(component_value, ContainerComponent):
+				self.container = component_value
+		elif component_name == "TaskHostComponent":
+			if isinstance(component_value, TaskHostComponent):
+				self.task_host = component_value
+		elif component_name == "TaskComponent":
+			# Compatible with old name: TaskComponent (TaskHostComponent wins when both exist)
+			if isinstance(component_value, TaskHostComponent) and self.task_host is None:
+				self.task_host = component_value
+		elif component_name == "WorkerComponent":
+			if isinstance(component_value, WorkerComponent):
+				self.worker = component_value
 
 	def get_component(self, component_name: str) -> ComponentValue | None:
 		return self.components.get(component_name)
@@ -65,8 +93,8 @@ class Entity:
 
 	# --- Container helpers ---
 	def get_container_item_ids(self) -> list[str]:
-		comp = self.components.get("ContainerComponent")
-		if isinstance(comp, ContainerComponent):
+		comp = self.container
+		if comp is not None:
 			return comp.get_all_item_ids()
 		return []
 
@@ -22,8 +22,10 @@ class Location:
 		return False
 
 	def remove_entity_id(self, entity_id: str) -> bool:
-		if entity_id in self.entities_in_location:
+		# list.remove does the membership scan itself: one pass instead of `in` + remove
+		try:
 			self.entities_in_location.remove(entity_id)
-			return True
-		return False
+		except ValueError:
+			return False
+		return True
 
@@ -1,15 +1,50 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
 from .entity import Entity
 from .gametime import GameTime
 from .location import Location
-from .components import ContainerComponent
 from .task import Task
 
 
+def _multi_index_put(primary: dict[str, Any], extra: dict[str, set[Any]], key: str, value: Any) -> None:
+	"""
+	Index key -> value; a different previous value is kept in extra (Its list was not told to drop the key).
+	"""
+
+	prev = primary.get(key)
+	primary[key] = value
+	others = extra.get(key)
+	if others is not None:
+		others.discard(value)
+	if prev is not None and prev != value:
+		if others is None:
+			others = extra[key] = set()
+		others.add(prev)
+	if others is not None and not others:
+		del extra[key]
+
+
+def _multi_index_drop(primary: dict[str, Any], extra: dict[str, set[Any]], key: str, drop: Callable[[Any], bool]) -> None:
+	"""
+	Forget the values of key matching drop; if the primary one goes, a remaining extra value takes its place.
+	"""
+
+	others = extra.get(key)
+	if others:
+		others.difference_update([v for v in others if drop(v)])
+	if key in primary and drop(primary[key]):
+		if others:
+			primary[key] = others.pop()
+		else:
+			del primary[key]
+	if others is not None and not others:
+		del extra[key]
+
+
 @dataclass
 class WorldState:
 	"""
@@ -50,6 +85,18 @@ class WorldState:
 	interaction_log: list[dict[str, Any]] = field(default_factory=list)
 	_interaction_seq: int = 0
 
+	# Reverse indexes (Intent: destroy/unlink an entity without scanning every location and every container slot)
+	# - _loc_of_entity: entity_id -> location_id (mirrors Location.entities_in_location)
+	# - _holder_of_entity: entity_id -> (holder_entity_id, slot_id) (mirrors ContainerSlot.items)
+	# - _extra_*: further locations / slots still listing the ID (Rare: added somewhere new without being removed
+	#   from the old place, e.g. TransferEntity with a wrong source_id); destroy clears those lists too, so no ID dangles
+	# Convention: runtime writes go through ensure_entity_in_location / ensure_entity_removed_from_location /
+	# add_item_to_container / remove_item_from_container; the builder calls rebuild_entity_indexes() once after loading.
+	_loc_of_entity: dict[str, str] = field(default_factory=dict, repr=False)
+	_extra_locs_of_entity: dict[str, set[str]] = field(default_factory=dict, repr=False)
+	_holder_of_entity: dict[str, tuple[str, str]] = field(default_factory=dict, repr=False)
+	_extra_holders_of_entity: dict[str, set[tuple[str, str]]] = field(default_factory=dict, repr=False)
+
 	def record_interaction_attempt(
 		self,
 		actor_id: str,
@@ -117,13 +164,18 @@ class WorldState:
 			return
 
 		ctx = context or {}
-		actor_id = str(ctx.get("agent_id", "") or ctx.get("actor_id", "") or "")
+		# Called for every executor event: IDs are already str, coerce only otherwise
+		actor_id = ctx.get("agent_id", "") or ctx.get("actor_id", "") or ""
+		if type(actor_id) is not str:
+			actor_id = str(actor_id)
 
 		loc_id = ""
 		if actor_id:
 			loc = self.get_location_of_entity(actor_id)
 			if loc is not None:
-				loc_id = str(getattr(loc, "location_id", "") or "")
+				loc_id = getattr(loc, "location_id", "") or ""
+				if type(loc_id) is not str:
+					loc_id = str(loc_id)
 
 		self._event_seq += 1
 		self.event_log.append(
@@ -175,6 +227,14 @@ class WorldState:
 			return None
 		visited.add(entity_id)
 
+		# 0) Reverse index (Checked against the location list: a stale entry falls through to the scan)
+		# (Skipped when several locations list the ID: the scan below picks the first one, as it always did)
+		loc_id = self._loc_of_entity.get(entity_id)
+		if loc_id is not None and entity_id not in self._extra_locs_of_entity:
+			loc = self.locations.get(loc_id)
+			if loc is not None and entity_id in loc.entities_in_location:
+				return loc
+
 		# 1) Search directly in location list
 		for loc in self.locations.values():
 			if entity_id in loc.entities_in_location:
@@ -189,45 +249,238 @@ class WorldState:
 
 	def _find_container_entity_holding_item(self, item_id: str) -> Entity | None:
 		for ent in self.entities.values():
-			comp = ent.get_component("ContainerComponent")
-			if isinstance(comp, ContainerComponent):
-				if item_id in comp.get_all_item_ids():
+			comp = ent.container
+			if comp is not None:
+				if comp.has_item_id(item_id):
 					return ent
 		return None
 
 	# --- Location Index Maintenance (Align with Godot WorldManager.ensure_entity_in_location / removed) ---
-	def ensure_entity_in_location(self, entity_id: str, location_id: str) -> None:
+	def ensure_entity_in_location(self, entity_id: str, location_id: str) -> bool:
 		loc = self.get_location_by_id(location_id)
 		if loc is None:
-			return
+			return False
+		_multi_index_put(self._loc_of_entity, self._extra_locs_of_entity, entity_id, loc.location_id)
 		if entity_id not in loc.entities_in_location:
 			loc.entities_in_location.append(entity_id)
+			return True
+		return False
 
-	def ensure_entity_removed_from_location(self, entity_id: str, location_id: str) -> None:
+	def ensure_entity_removed_from_location(self, entity_id: str, location_id: str) -> bool:
+		_multi_index_drop(self._loc_of_entity, self._extra_locs_of_entity, entity_id, location_id.__eq__)
 		loc = self.get_location_by_id(location_id)
 		if loc is None:
-			return
-		if entity_id in loc.entities_in_location:
-			loc.entities_in_location.remove(entity_id)
+			return False
+		return loc.remove_entity_id(entity_id)
+
+	# --- Container Index Maintenance ---
+	def add_item_to_container(self, holder: Entity, item_entity: Entity, target_slot_id: str = "") -> bool:
+		cc = holder.container
+		if cc is None:
+			return False
+		slot_id = cc.place_entity(item_entity, target_slot_id)
+		if not slot_id:
+			return False
+		_multi_index_put(self._holder_of_entity, self._extra_holders_of_entity, item_entity.entity_id, (holder.entity_id, slot_id))
+		return True
+
+	def place_item_in_container(self, holder: Entity, item_entity: Entity, target_slot_id: str = "") -> bool:
+		"""
+		Container insertion + Double Indexing (Item also listed in the holder's location) in one call.
+		"""
 
-	def move_ids_between_locations(self, ids: list[str], from_location_id: str, to_location_id: str) -> None:
+		if not self.add_item_to_container(holder, item_entity, target_slot_id):
+			return False
+		loc = self.get_location_of_entity(holder.entity_id)
+		if loc is not None:
+			self.ensure_entity_in_location(item_entity.entity_id, loc.location_id)
+		return True
+
+	def remove_item_from_container(self, holder: Entity, item_id: str) -> bool:
+		cc = holder.container
+		if cc is None:
+			return False
+		if not cc.remove_entity_by_id(item_id):
+			return False
+		holder_id = holder.entity_id
+		slots = cc.slots
+
+		def gone(held: tuple[str, str]) -> bool:
+			# Only this holder's entries whose slot no longer lists the item (Loaded data may list it twice)
+			if held[0] != holder_id:
+				return False
+			slot = slots.get(held[1])
+			return slot is None or item_id not in slot.items
+
+		_multi_index_drop(self._holder_of_entity, self._extra_holders_of_entity, item_id, gone)
+		return True
+
+	def unlink_entities(self, entity_ids: Iterable[str]) -> None:
+		"""
+		Remove entity IDs from their location index and holding container (Destroy path).
+		Explanation: Victims are grouped by location / holder slot via the reverse indexes, so each touched list is
+		filtered once instead of scanning all locations / all containers per ID; further locations / slots still listing
+		an ID (_extra_* indexes) are filtered too, and a stale index entry (list mutated behind the index's back) falls
+		back to the full scan so nothing dangles.
+		"""
+
+		ids = entity_ids if isinstance(entity_ids, (set, frozenset, dict)) else set(entity_ids)
+		loc_of = self._loc_of_entity
+		extra_locs_of = self._extra_locs_of_entity
+		holder_of = self._holder_of_entity
+		extra_holders_of = self._extra_holders_of_entity
+
+		by_loc: dict[str, set[str]] = {}
+		by_extra_loc: dict[str, set[str]] = {}
+		by_slot: dict[tuple[str, str], set[str]] = {}
+		by_extra_slot: dict[tuple[str, str], set[str]] = {}
 		for eid in ids:
-			self.ensure_entity_removed_from_location(eid, from_location_id)
-			self.ensure_entity_in_location(eid, to_location_id)
+			loc_id = loc_of.pop(eid, None)
+			if loc_id is not None:
+				by_loc.setdefault(loc_id, set()).add(eid)
+			extra = extra_locs_of.pop(eid, None)
+			if extra:
+				for other_loc_id in extra:
+					by_extra_loc.setdefault(other_loc_id, set()).add(eid)
+			held = holder_of.pop(eid, None)
+			# A holder that is itself being removed needs no slot cleanup
+			if held is not None and held[0] not in ids:
+				by_slot.setdefault(held, set()).add(eid)
+			extra = extra_holders_of.pop(eid, None)
+			if extra:
+				for other_held in extra:
+					if other_held[0] not in ids:
+						by_extra_slot.setdefault(other_held, set()).add(eid)
+
+		for loc_id, gone in by_loc.items():
+			loc = self.locations.get(loc_id)
+			missing = gone
+			if loc is not None:
+				items = loc.entities_in_location
+				missing = gone.difference(items)
+				items[:] = [x for x in items if x not in gone]
+			if missing:
+				for other in self.locations.values():
+					other.entities_in_location[:] = [x for x in other.entities_in_location if x not in missing]
+
+		for loc_id, gone in by_extra_loc.items():
+			loc = self.locations.get(loc_id)
+			if loc is not None:
+				loc.entities_in_location[:] = [x for x in loc.entities_in_location if x not in gone]
+
+		for (holder_id, slot_id), gone in by_slot.items():
+			holder = self.entities.get(holder_id)
+			cc = holder.container if holder is not None else None
+			missing = gone
+			if cc is not None:
+				slot = cc.slots.get(slot_id)
+				if slot is not None:
+					missing = gone.difference(slot.items)
+					slot.items[:] = [x for x in slot.items if x not in gone]
+			if missing:
+				for ent in self.entities.values():
+					other_cc = ent.container
+					if other_cc is not None:
+						for slot in other_cc.slots.values():
+							slot.items[:] = [x for x in slot.items if x not in missing]
+
+		for (holder_id, slot_id), gone in by_extra_slot.items():
+			holder = self.entities.get(holder_id)
+			cc = holder.container if holder is not None else None
+			slot = cc.slots.get(slot_id) if cc is not None else None
+			if slot is not None:
+				slot.items[:] = [x for x in slot.items if x not in gone]
+
+	def rebuild_entity_indexes(self) -> None:
+		"""
+		Rebuild _loc_of_entity / _holder_of_entity from the location lists and container slots (After bulk loading).
+		First hit wins, same order as get_location_of_entity / _find_container_entity_holding_item; further locations /
+		slots listing the same ID go to _extra_locs_of_entity / _extra_holders_of_entity.
+		"""
+
+		loc_of = self._loc_of_entity
+		extra_locs_of = self._extra_locs_of_entity
+		holder_of = self._holder_of_entity
+		extra_holders_of = self._extra_holders_of_entity
+		loc_of.clear()
+		extra_locs_of.clear()
+		holder_of.clear()
+		extra_holders_of.clear()
+		for loc in self.locations.values():
+			loc_id = loc.location_id
+			for eid in loc.entities_in_location:
+				first = loc_of.setdefault(eid, loc_id)
+				if first != loc_id:
+					extra_locs_of.setdefault(eid, set()).add(loc_id)
+		for ent in self.entities.values():
+			cc = ent.container
+			if cc is None:
+				continue
+			holder_id = ent.entity_id
+			for slot_id, slot in cc.slots.items():
+				for item_id in slot.items:
+					held = (holder_id, slot_id)
+					if holder_of.setdefault(item_id, held) != held:
+						extra_holders_of.setdefault(item_id, set()).add(held)
+
+	def move_ids_between_locations(self, ids: list[str], from_location_id: str, to_location_id: str) -> None:
+		"""
+		Move IDs from one location's index to another's (Cross-location cascade transfer).
+		Explanation: Source list is filtered once and destination membership is checked against a set, instead of
+		list.remove + `in` scans per ID; IDs are appended to the destination in the given order, as before.
+		"""
+
+		# Ordered and de-duplicated (A nesting cycle can list an ID twice)
+		moving = dict.fromkeys(ids)
+		if not moving:
+			return
+		loc_of = self._loc_of_entity
+		extra_locs_of = self._extra_locs_of_entity
+		from_matches = from_location_id.__eq__
+		for eid in moving:
+			_multi_index_drop(loc_of, extra_locs_of, eid, from_matches)
+
+		src = self.get_location_by_id(from_location_id)
+		if src is not None:
+			items = src.entities_in_location
+			items[:] = [x for x in items if x not in moving]
+
+		dst = self.get_location_by_id(to_location_id)
+		if dst is None:
+			return
+		dst_id = dst.location_id
+		dst_items = dst.entities_in_location
+		present = set(dst_items)
+		for eid in moving:
+			_multi_index_put(loc_of, extra_locs_of, eid, dst_id)
+			if eid not in present:
+				dst_items.append(eid)
+				present.add(eid)
 
 	def collect_descendant_item_ids(self, root_entity_id: str) -> list[str]:
 		"""
-		Recursively collect descendant item IDs of container entity (Align with Godot collect_descendant_item_ids).
+		Collect descendant item IDs of container entity (Align with Godot collect_descendant_item_ids).
+		Explanation: Explicit stack instead of recursion (No per-level list building); same pre-order as before,
+		and an ID already collected is not expanded again (A nesting cycle cannot loop forever).
 		"""
 		collected: list[str] = []
 		root = self.get_entity_by_id(root_entity_id)
-		if root is None:
-			return collected
-		comp = root.get_component("ContainerComponent")
-		if not isinstance(comp, ContainerComponent):
+		if root is None or root.container is None:
 			return collected
-		for child_id in comp.get_all_item_ids():
+		entities = self.entities
+		seen = {root_entity_id}
+		stack = root.container.get_all_item_ids()
+		stack.reverse()
+		while stack:
+			child_id = stack.pop()
 			collected.append(child_id)
-			collected.extend(self.collect_descendant_item_ids(child_id))
+			if child_id in seen:
+				continue
+			seen.add(child_id)
+			child = entities.get(child_id)
+			if child is not None and child.container is not None:
+				grandchildren = child.container.get_all_item_ids()
+				grandchildren.reverse()
+				stack.extend(grandchildren)
 		return collected
 
@@ -24,7 +24,8 @@ class LowNutritionRule:
 		if not isinstance(creature, CreatureComponent):
 			return InterruptResult(interrupt=False, rule_type="LowNutrition", priority=self.priority)
 
-		creature.ensure_initialized()
+		if not creature.initialized:
+			creature.ensure_initialized()
 		if creature.current_nutrition is None:
 			return InterruptResult(interrupt=False, rule_type="LowNutrition", priority=self.priority)
 
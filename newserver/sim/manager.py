@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
+from ..env import env_flag
 from ..models.world_state import WorldState
 
 
+# Read once at import: checked on every tick and every executed effect
+_VERBOSE_EVENTS = env_flag("VERBOSE_EVENTS")
+
+
 @dataclass
 class WorldManager:
 	"""
@@ -38,13 +44,26 @@ class WorldManager:
 		"""
 		Run for max_ticks ticks, return accumulated event list.
 		"""
+		return list(self.run_iter(max_ticks))
+
+	def run_iter(self, max_ticks: int = 1, event_filter: frozenset[str] | None = None) -> Iterator[dict[str, Any]]:
+		"""
+		Run for max_ticks ticks, yielding events tick by tick (the full event log is never accumulated).
+
+		Explanation:
+		- event_filter: if given, only events whose type is in the set are yielded (the world log still records everything)
+		"""
 		self.is_running = True
-		all_events: list[dict[str, Any]] = []
 		for _ in range(int(max_ticks)):
 			if not self.is_running:
 				break
-			all_events.extend(self.step())
-		return all_events
+			tick_events = self.step()
+			if event_filter is None:
+				yield from tick_events
+			else:
+				for ev in tick_events:
+					if isinstance(ev, dict) and ev.get("type") in event_filter:
+						yield ev
 
 	def stop(self) -> None:
 		self.is_running = False
@@ -64,7 +83,7 @@ class WorldManager:
 				"time": self.world_state.game_time.time_to_string(),
 			}
 		)
-		verbose = str(__import__("os").environ.get("VERBOSE_EVENTS", "") or "").strip() == "1"
+		verbose = _VERBOSE_EVENTS
 		if verbose:
 			print(f"\n[Tick] {events[-1]['total_ticks']} time={events[-1]['time']}")
 		# Tick events are also written to world log (for debug/replay; LLM usually doesn't need such detail, can filter in observation layer).
@@ -88,13 +107,16 @@ class WorldManager:
 
         # Helper wrapper to be used by components via ws.services["execute"](...)
 		def execute_wrapper(effect: dict[str, Any], context: dict[str, Any]) -> None:
-			verbose = str(__import__("os").environ.get("VERBOSE_EVENTS", "") or "").strip() == "1"
 			if verbose:
 				print(f"[Effect] {effect.get('effect')}: {effect} ctx={context}")
 			result_events = self.executor.execute(self.world_state, effect, context)
-			for ev in list(result_events or []):
+			if not result_events:
+				return
+			# Executor returns a fresh list: iterate it directly, no snapshot copy
+			record_event = self.world_state.record_event
+			for ev in result_events:
 				if isinstance(ev, dict):
-					self.world_state.record_event(ev, context)
+					record_event(ev, context)
 					if verbose:
 						print(f"[Event] {ev.get('type')}: {ev}")
 			events.extend(result_events)